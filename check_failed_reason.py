@@ -29,12 +29,13 @@ print("=" * 80)
 
 for file_path_str, short_name in test_files:
     file_path = Path(file_path_str)
+    exists = file_path.exists()
     
     print(f"\nFile: {short_name}")
     print(f"  Full path: {file_path}")
-    print(f"  Exists: {file_path.exists()}")
+    print(f"  Exists: {exists}")
     
-    if file_path.exists():
+    if exists:
         # Test date parsing
         parsed_date = parse_date_from_path(file_path)
         validated_date = validate_date_parsing(file_path)
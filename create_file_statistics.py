@@ -2,9 +2,30 @@
 Count files in filtered_data folders and create statistics table.
 """
 
+import os
 from pathlib import Path
 import pandas as pd
 
+
+def _count_txt(path: str) -> int:
+    """Recursively count .txt files under a directory without building Path objects.
+    
+    Args:
+        path: Directory path
+        
+    Returns:
+        Number of .txt files (suffix matched in any case, as rglob on Windows)
+    """
+    n = 0
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                n += _count_txt(entry.path)
+            elif entry.name.lower().endswith('.txt') and entry.is_file(follow_symlinks=False):
+                n += 1
+    return n
+
+
 def count_files_in_folders(filtered_dir: Path) -> pd.DataFrame:
     """Count files in each folder under filtered_data.
     
@@ -16,15 +37,17 @@ def count_files_in_folders(filtered_dir: Path) -> pd.DataFrame:
     """
     stats = []
     
-    for folder in sorted(filtered_dir.iterdir()):
-        if folder.is_dir():
-            # Count all .txt files recursively
-            file_count = len(list(folder.rglob('*.txt')))
-            stats.append({
-                'Folder': folder.name,
-                'File_Count': file_count
-            })
-            print(f"{folder.name}: {file_count} files")
+    with os.scandir(filtered_dir) as it:
+        folders = sorted((entry for entry in it if entry.is_dir()), key=lambda e: e.name)
+    
+    for folder in folders:
+        # Count all .txt files recursively
+        file_count = _count_txt(folder.path)
+        stats.append({
+            'Folder': folder.name,
+            'File_Count': file_count
+        })
+        print(f"{folder.name}: {file_count} files")
     
     df = pd.DataFrame(stats)
     return df
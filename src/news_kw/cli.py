@@ -5,7 +5,6 @@ import os
 import sys
 import warnings
 from pathlib import Path
-from news_kw.pipeline import run_pipeline
 
 
 def check_conda_environment():
@@ -130,7 +129,8 @@ def main():
             f"Please provide at least one of them."
         )
     
-    # Run pipeline
+    # Run pipeline (imported here so --help and path errors skip the heavy imports)
+    from news_kw.pipeline import run_pipeline
     run_pipeline(
         config_path=args.config,
         input_dir=args.input_dir,
@@ -1,15 +1,58 @@
 """Configuration management using dataclass and YAML."""
 
+import copy
+import os
+import sys
 import warnings
 import yaml
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, fields, replace
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Union
+from typing import Collection, Optional, List, Dict, Union, FrozenSet
+from news_kw.exclude import load_exclude_keywords
 
+# libyaml-backed loader when available (same results as SafeLoader, much faster)
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
-@dataclass
+
+@lru_cache(maxsize=8)
+def _parse_yaml(yaml_path_str: str, mtime_key: float) -> dict:
+    """Parse a YAML file.
+    
+    Args:
+        yaml_path_str: Resolved path of the YAML file
+        mtime_key: Modification time of the file
+            (only used to invalidate the cache when the file changes)
+    
+    Returns:
+        Parsed mapping (empty dict for an empty file)
+    """
+    with open(yaml_path_str, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
+
+def load_yaml_config(yaml_path: Path) -> dict:
+    """Load a YAML configuration file.
+    
+    The same config file is read by several steps of a run (Config.from_yaml,
+    file filtering), so the parsed result is cached until the file is modified.
+    
+    Args:
+        yaml_path: Path to YAML configuration file
+    
+    Returns:
+        Parsed mapping (a fresh copy that callers may modify)
+    """
+    data = _parse_yaml(str(yaml_path.resolve()), yaml_path.stat().st_mtime)
+    return copy.deepcopy(data)
+
+
+@dataclass(frozen=True)
 class Config:
-    """Configuration for keyword analysis pipeline."""
+    """Configuration for keyword analysis pipeline.
+    
+    Instances are immutable; use dataclasses.replace to derive a modified copy.
+    """
     
     # DATA_SOURCE_GROUPS can be:
     # - List of strings (single folder per group): ["meeting", "news"]
@@ -24,6 +67,11 @@ class Config:
     COOC_NODE_TOP_N: int = 60
     COOC_EDGE_TOP_N: int = 300
     COOC_LABEL_TOP_N: int = 25
+    # "csv" (default) or "parquet" to also write Parquet copies of the network tables
+    COOC_OUTPUT_FORMAT: str = "csv"
+    # PDF text backend: "pdfplumber" (default, reference output), "pypdfium2",
+    # "pymupdf", or "auto" for the fastest installed one (text differs slightly)
+    PDF_BACKEND: str = "pdfplumber"
     WORDCLOUD_TOP_N: int = 200
     WORDCLOUD_MAX_WORDS: int = 200
     WORDCLOUD_WIDTH: int = 1400
@@ -31,38 +79,27 @@ class Config:
     WORDCLOUD_BACKGROUND: str = "white"
     WORDCLOUD_OUTPUT_NAME: str = "py_wordcloud.png"
     
+    @cached_property
+    def all_folders(self) -> FrozenSet[str]:
+        """All folder names used by DATA_SOURCE_GROUPS (computed once per instance)."""
+        groups = self.DATA_SOURCE_GROUPS
+        if not isinstance(groups, dict):
+            groups = self._normalize_data_source_groups(groups)
+        return frozenset().union(*groups.values())
+    
     @staticmethod
-    def load_exclude_keywords(exclude_dir: Path) -> List[str]:
+    def load_exclude_keywords(exclude_dir: Path) -> FrozenSet[str]:
         """Load exclude keywords from data/exclude folder.
         
-        Reads all .txt files in the exclude directory and extracts
-        comma-separated keywords from each file.
+        Thin wrapper around news_kw.exclude.load_exclude_keywords (cached).
         
         Args:
             exclude_dir: Directory containing exclude keyword files
             
         Returns:
-            List of exclude keywords (lowercased, deduplicated)
+            Frozenset of exclude keywords (lowercased, deduplicated)
         """
-        exclude_keywords = []
-        
-        if not exclude_dir.exists():
-            return exclude_keywords
-        
-        # Read all .txt files in exclude directory
-        for txt_file in exclude_dir.glob('*.txt'):
-            try:
-                with open(txt_file, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                    if content:
-                        # Split by comma and clean up
-                        keywords = [kw.strip().lower() for kw in content.split(',') if kw.strip()]
-                        exclude_keywords.extend(keywords)
-            except Exception as e:
-                warnings.warn(f"Error reading exclude file {txt_file}: {e}")
-        
-        # Remove duplicates and return
-        return list(set(exclude_keywords))
+        return load_exclude_keywords(exclude_dir)
     
     @classmethod
     def _normalize_data_source_groups(cls, groups: Union[List[Union[str, List[str]]], Dict[str, List[str]]]) -> Dict[str, List[str]]:
@@ -74,6 +111,7 @@ class Config:
         Returns:
             Dict mapping group names to folder lists
         """
+        # Already normalized (e.g. from_dict on to_dict output) - nothing to do
         if isinstance(groups, dict):
             return groups
         
@@ -81,45 +119,68 @@ class Config:
             # Single string or other type - wrap it
             groups = [groups]
         
+        # Names are interned so the many group/folder dict lookups downstream
+        # compare by identity
         normalized = {}
         for item in groups:
             if isinstance(item, str):
                 # Single folder - use folder name as group name
-                normalized[item] = [item]
+                folder = sys.intern(item)
+                normalized[folder] = [folder]
             elif isinstance(item, list):
                 # Multiple folders - create group name from folder names
-                if len(item) == 1:
-                    group_name = item[0]
+                folders = [sys.intern(f) if isinstance(f, str) else f for f in item]
+                if len(folders) == 1:
+                    group_name = folders[0]
                 else:
-                    group_name = '_'.join(item)
-                normalized[group_name] = item
+                    group_name = sys.intern('_'.join(folders))
+                normalized[group_name] = folders
             else:
                 warnings.warn(f"Invalid group item: {item}, skipping")
         
         return normalized
     
     @staticmethod
-    def validate_folders(folders: List[str], input_dir: Path) -> tuple[bool, List[str], List[str]]:
+    def _list_subfolders(input_dir: Path) -> List[str]:
+        """List subdirectory names of a directory.
+        
+        Args:
+            input_dir: Directory to scan
+            
+        Returns:
+            Sorted list of subdirectory names (empty if input_dir does not exist)
+        """
+        if not input_dir.exists():
+            return []
+        # DirEntry.is_dir() uses the type from the directory listing, no extra stat
+        with os.scandir(input_dir) as entries:
+            return sorted(entry.name for entry in entries if entry.is_dir())
+    
+    @staticmethod
+    def validate_folders(folders: Collection[str], input_dir: Path,
+                         existing_folders: Optional[List[str]] = None) -> tuple[bool, List[str], List[str]]:
         """Validate that folder names exist in the input directory.
         
         Args:
-            folders: List of folder names to validate
+            folders: Folder names to validate
             input_dir: Base input directory (e.g., data/raw_txt)
+            existing_folders: Subdirectory names of input_dir if already scanned
+                (scanned here when None)
             
         Returns:
             Tuple of (is_valid, valid_folders, invalid_folders)
         """
-        if not input_dir.exists():
-            return False, [], folders
-        
-        # Get all subdirectories in input_dir
-        existing_folders = {d.name for d in input_dir.iterdir() if d.is_dir()}
+        if existing_folders is None:
+            if not input_dir.exists():
+                return False, [], list(folders)
+            existing_folders = Config._list_subfolders(input_dir)
         
+        existing_set = set(existing_folders)
         valid_folders = []
         invalid_folders = []
         
         for folder in folders:
-            if folder in existing_folders:
+            if folder in existing_set:
                 valid_folders.append(folder)
             else:
                 invalid_folders.append(folder)
@@ -127,6 +188,27 @@ class Config:
         is_valid = len(invalid_folders) == 0
         return is_valid, valid_folders, invalid_folders
     
+    @classmethod
+    def from_dict(cls, data: dict) -> "Config":
+        """Build a Config from a dict (e.g. parsed YAML or to_dict output).
+        
+        Args:
+            data: Mapping of config keys to values; unknown keys are ignored
+            
+        Returns:
+            Config instance with DATA_SOURCE_GROUPS normalized to Dict format
+        """
+        config = cls(**{key: value for key, value in data.items() if key in _CONFIG_FIELDS})
+        
+        # Normalize DATA_SOURCE_GROUPS to Dict format
+        if config.DATA_SOURCE_GROUPS:
+            config = replace(
+                config,
+                DATA_SOURCE_GROUPS=cls._normalize_data_source_groups(config.DATA_SOURCE_GROUPS)
+            )
+        
+        return config
+    
     @classmethod
     def from_yaml(cls, yaml_path: Path, input_dir: Optional[Path] = None) -> "Config":
         """Load configuration from YAML file.
@@ -141,19 +223,11 @@ class Config:
         Raises:
             ValueError: If folder validation fails
         """
-        config = cls()
-        
+        yaml_data = {}
         if yaml_path.exists():
-            with open(yaml_path, 'r', encoding='utf-8') as f:
-                yaml_data = yaml.safe_load(f) or {}
-            
-            for key, value in yaml_data.items():
-                if hasattr(config, key):
-                    setattr(config, key, value)
+            yaml_data = load_yaml_config(yaml_path)
         
-        # Normalize DATA_SOURCE_GROUPS to Dict format
-        if hasattr(config, 'DATA_SOURCE_GROUPS') and config.DATA_SOURCE_GROUPS:
-            config.DATA_SOURCE_GROUPS = cls._normalize_data_source_groups(config.DATA_SOURCE_GROUPS)
+        config = cls.from_dict(yaml_data)
         
         # Legacy support: if DATA_SOURCE_GROUPS is not set but DATA_SOURCE_FOLDERS is,
         # create a default group
@@ -164,21 +238,18 @@ class Config:
                 if isinstance(folders, list) and folders:
                     # Create a single group with all folders
                     group_name = '_'.join(folders) if len(folders) > 1 else folders[0]
-                    config.DATA_SOURCE_GROUPS = {group_name: folders}
+                    config = replace(config, DATA_SOURCE_GROUPS={group_name: folders})
         
         # Validate folders if input_dir is provided
         if input_dir and config.DATA_SOURCE_GROUPS:
             if isinstance(config.DATA_SOURCE_GROUPS, dict):
-                all_folders = set()
-                for folders_list in config.DATA_SOURCE_GROUPS.values():
-                    all_folders.update(folders_list)
-                
+                # Scan input_dir once for both validation and the error message
+                existing_folders = cls._list_subfolders(input_dir)
                 is_valid, valid_folders, invalid_folders = cls.validate_folders(
-                    list(all_folders), input_dir
+                    config.all_folders, input_dir, existing_folders
                 )
                 
                 if not is_valid:
-                    existing_folders = sorted({d.name for d in input_dir.iterdir() if d.is_dir()})
                     error_msg = (
                         f"폴더명 검증 실패: 다음 폴더들이 '{input_dir}' 아래에 존재하지 않습니다:\n"
                         f"  잘못된 폴더명: {', '.join(invalid_folders)}\n"
@@ -192,19 +263,8 @@ class Config:
     
     def to_dict(self) -> dict:
         """Convert config to dictionary."""
-        return {
-            'DATA_SOURCE_GROUPS': self.DATA_SOURCE_GROUPS,
-            'DATA_SOURCE_FOLDERS': self.DATA_SOURCE_FOLDERS,
-            'KEYWORD_TOP_N': self.KEYWORD_TOP_N,
-            'TREND_PLOT_TOP_N': self.TREND_PLOT_TOP_N,
-            'COOC_NODE_TOP_N': self.COOC_NODE_TOP_N,
-            'COOC_EDGE_TOP_N': self.COOC_EDGE_TOP_N,
-            'COOC_LABEL_TOP_N': self.COOC_LABEL_TOP_N,
-            'WORDCLOUD_TOP_N': self.WORDCLOUD_TOP_N,
-            'WORDCLOUD_MAX_WORDS': self.WORDCLOUD_MAX_WORDS,
-            'WORDCLOUD_WIDTH': self.WORDCLOUD_WIDTH,
-            'WORDCLOUD_HEIGHT': self.WORDCLOUD_HEIGHT,
-            'WORDCLOUD_BACKGROUND': self.WORDCLOUD_BACKGROUND,
-            'WORDCLOUD_OUTPUT_NAME': self.WORDCLOUD_OUTPUT_NAME,
-        }
+        return asdict(self)
+
 
+# Field names accepted by Config.from_dict
+_CONFIG_FIELDS = frozenset(f.name for f in fields(Config))
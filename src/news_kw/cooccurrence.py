@@ -1,11 +1,154 @@
 """Keyword co-occurrence network analysis."""
 
 from pathlib import Path
+from typing import Tuple
+import numpy as np
 import pandas as pd
 import warnings
-from collections import defaultdict
 from news_kw.config import Config
 
+# Above this many distinct tokens the dense n x n co-occurrence matrix
+# (8 * n^2 bytes) is not built and pairs are counted with a self-join instead
+_DENSE_MAX_NODES = 2048
+
+# Upper bound on the elements of one documents x nodes incidence block
+_INCIDENCE_MAX_ELEMENTS = 1 << 22
+
+# Token occurrences per self-join block in the sparse path
+_PAIR_BLOCK_ROWS = 1 << 20
+
+
+def _count_pairs_dense(doc_sorted: np.ndarray, tok_sorted: np.ndarray, n: int,
+                       num_docs: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Count pairs as incidence.T @ incidence over blocks of documents (BLAS).
+    
+    Args:
+        doc_sorted: Document code of each unique (document, token), sorted
+        tok_sorted: Token code of each unique (document, token), aligned
+        n: Number of distinct tokens
+        num_docs: Number of distinct documents
+        
+    Returns:
+        Tuple of (ascending pair codes a * n + b with a < b, pair counts)
+    """
+    block_size = max(1, _INCIDENCE_MAX_ELEMENTS // n)
+    co = np.zeros((n, n), dtype=np.float64)
+    for block_start in range(0, num_docs, block_size):
+        block_end = min(block_start + block_size, num_docs)
+        lo, hi = np.searchsorted(doc_sorted, [block_start, block_end])
+        incidence = np.zeros((block_end - block_start, n), dtype=np.float64)
+        incidence[doc_sorted[lo:hi] - block_start, tok_sorted[lo:hi]] = 1.0
+        co += incidence.T @ incidence
+    
+    # Keep each unordered pair once (a < b); counts are exact integers in float64
+    counts = np.rint(np.triu(co, k=1)).astype(np.int64).ravel()
+    pair_codes = np.flatnonzero(counts)
+    return pair_codes, counts[pair_codes]
+
+
+def _count_pairs_sparse(doc_sorted: np.ndarray, tok_sorted: np.ndarray,
+                        n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Count pairs with a self-join on document, in blocks of documents.
+    
+    Memory is bounded by the number of pairs in a block rather than n^2.
+    
+    Args:
+        doc_sorted: Document code of each unique (document, token), sorted
+        tok_sorted: Token code of each unique (document, token), aligned
+        n: Number of distinct tokens
+        
+    Returns:
+        Tuple of (ascending pair codes a * n + b with a < b, pair counts)
+    """
+    block_codes = []
+    block_counts = []
+    num_rows = len(doc_sorted)
+    block_start = 0
+    while block_start < num_rows:
+        # Extend the block to the end of its last document so no document is split
+        block_end = min(block_start + _PAIR_BLOCK_ROWS, num_rows)
+        if block_end < num_rows:
+            block_end = int(np.searchsorted(doc_sorted, doc_sorted[block_end - 1], side='right'))
+        block = pd.DataFrame({'doc': doc_sorted[block_start:block_end],
+                              'tok': tok_sorted[block_start:block_end]})
+        pairs = block.merge(block, on='doc')
+        pairs = pairs[pairs['tok_x'] < pairs['tok_y']]
+        codes, counts = np.unique(
+            pairs['tok_x'].to_numpy(np.int64) * n + pairs['tok_y'].to_numpy(np.int64),
+            return_counts=True
+        )
+        block_codes.append(codes)
+        block_counts.append(counts)
+        block_start = block_end
+    
+    if not block_codes:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+    
+    # Sum the per-block counts of pairs seen in several blocks
+    totals = (
+        pd.Series(np.concatenate(block_counts), index=np.concatenate(block_codes))
+        .groupby(level=0, sort=True)
+        .sum()
+    )
+    return totals.index.to_numpy(np.int64), totals.to_numpy(np.int64)
+
+
+def _count_token_pairs(doc_ids: pd.Series, tokens: pd.Series) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Count documents in which each unordered token pair co-occurs.
+    
+    Tokens are factorized in sorted order, so for a pair code ``a * n + b``
+    with ``a < b`` the token ``uniques[a]`` sorts before ``uniques[b]``.
+    Up to _DENSE_MAX_NODES distinct tokens the counts come from a blocked
+    incidence-matrix product; above that from a self-join whose memory is
+    bounded by the number of pairs.
+    
+    Args:
+        doc_ids: Document id of each token occurrence
+        tokens: Token of each occurrence (aligned with doc_ids)
+        
+    Returns:
+        Tuple of (sorted unique tokens, ascending pair codes of the pairs
+        that co-occur, their document counts)
+    """
+    tok_codes, uniques = pd.factorize(tokens, sort=True)
+    doc_codes, doc_uniques = pd.factorize(doc_ids)
+    n = len(uniques)
+    if n < 2:
+        return np.asarray(uniques), np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+    
+    # One row per (document, token), sorted by document; missing ids or
+    # tokens (code -1) take part in no pair
+    valid = (doc_codes >= 0) & (tok_codes >= 0)
+    doc_tok = np.unique(doc_codes[valid].astype(np.int64) * n + tok_codes[valid])
+    doc_sorted, tok_sorted = np.divmod(doc_tok, n)
+    
+    if n <= _DENSE_MAX_NODES:
+        pair_codes, counts = _count_pairs_dense(doc_sorted, tok_sorted, n, len(doc_uniques))
+    else:
+        pair_codes, counts = _count_pairs_sparse(doc_sorted, tok_sorted, n)
+    return np.asarray(uniques), pair_codes, counts
+
+
+def _save_network(nodes: pd.DataFrame, edges: pd.DataFrame, output_dir: Path, output_format: str = 'csv'):
+    """Save co-occurrence nodes and edges tables.
+    
+    CSV files are always written since the map plots (Python and R) read them.
+    
+    Args:
+        nodes: Nodes table (token, doc_freq)
+        edges: Edges table (source, target, weight)
+        output_dir: Directory to save output tables
+        output_format: 'csv', or 'parquet' to also write Parquet copies
+    """
+    if output_format not in ('csv', 'parquet'):
+        warnings.warn(f"Unknown COOC_OUTPUT_FORMAT: {output_format}, writing CSV only")
+    
+    for name, table in (('nodes', nodes), ('edges', edges)):
+        table_path = output_dir / f'cooccurrence_{name}.csv'
+        table.to_csv(table_path, index=False)
+        if output_format == 'parquet':
+            table.to_parquet(table_path.with_suffix('.parquet'), index=False, compression='snappy')
+
 
 def calculate_cooccurrence(tokens_df: pd.DataFrame, config: Config, output_dir: Path, exclude_keywords: list = None):
     """Calculate keyword co-occurrence network.
@@ -18,10 +161,19 @@ def calculate_cooccurrence(tokens_df: pd.DataFrame, config: Config, output_dir:
     """
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Filter out excluded keywords (case-insensitive)
-    if exclude_keywords:
-        exclude_set = {kw.lower() for kw in exclude_keywords}
-        tokens_df = tokens_df[~tokens_df['token'].str.lower().isin(exclude_set)].copy()
+    # Hash token strings once; filters below work on integer category codes
+    token_cat = tokens_df['token'].astype('category')
+    codes = token_cat.cat.codes.to_numpy()
+    
+    # Filter out excluded keywords (case-insensitive), testing each distinct token once
+    exclude_set = frozenset(kw.lower() for kw in (exclude_keywords or ()))
+    if exclude_set:
+        # Trailing False makes code -1 (missing token) map to "not excluded"
+        excluded_by_code = np.append(token_cat.cat.categories.str.lower().isin(exclude_set), False)
+        keep = ~excluded_by_code[codes]
+        tokens_df = tokens_df[keep]
+        token_cat = token_cat[keep]
+        codes = codes[keep]
     
     # Check if we have any tokens after filtering
     if len(tokens_df) == 0:
@@ -29,69 +181,50 @@ def calculate_cooccurrence(tokens_df: pd.DataFrame, config: Config, output_dir:
         # Create empty files
         nodes = pd.DataFrame(columns=['token', 'doc_freq'])
         edges = pd.DataFrame(columns=['source', 'target', 'weight'])
-        nodes_path = output_dir / 'cooccurrence_nodes.csv'
-        edges_path = output_dir / 'cooccurrence_edges.csv'
-        nodes.to_csv(nodes_path, index=False)
-        edges.to_csv(edges_path, index=False)
+        _save_network(nodes, edges, output_dir, config.COOC_OUTPUT_FORMAT)
         return
     
     # Calculate document frequency for each token
-    doc_freq = tokens_df.groupby('token')['doc_id'].nunique().reset_index()
-    doc_freq.columns = ['token', 'doc_freq']
-    doc_freq = doc_freq.sort_values('doc_freq', ascending=False)
-    
-    # Filter out excluded keywords from doc_freq as well (safety check)
-    if exclude_keywords:
-        exclude_set = {kw.lower() for kw in exclude_keywords}
-        doc_freq = doc_freq[~doc_freq['token'].str.lower().isin(exclude_set)].copy()
-    
-    # Check if we have any tokens after filtering
-    if len(doc_freq) == 0:
-        warnings.warn(f"No tokens available for co-occurrence analysis after filtering in {output_dir}")
-        # Create empty files
-        nodes = pd.DataFrame(columns=['token', 'doc_freq'])
-        edges = pd.DataFrame(columns=['source', 'target', 'weight'])
-        nodes_path = output_dir / 'cooccurrence_nodes.csv'
-        edges_path = output_dir / 'cooccurrence_edges.csv'
-        nodes.to_csv(nodes_path, index=False)
-        edges.to_csv(edges_path, index=False)
-        return
+    doc_freq = (
+        pd.DataFrame({'token': token_cat, 'doc_id': tokens_df['doc_id']})
+        .drop_duplicates()
+        .groupby('token', observed=True, sort=False)
+        .size()
+        .reset_index(name='doc_freq')
+    )
     
-    # Get top N nodes by document frequency
-    top_nodes = set(doc_freq.head(config.COOC_NODE_TOP_N)['token'])
+    # Get top N nodes by document frequency (partial selection, no full sort)
+    top_nodes = doc_freq.nlargest(config.COOC_NODE_TOP_N, 'doc_freq')['token']
     
     # Filter tokens to top nodes only
-    filtered_tokens = tokens_df[tokens_df['token'].isin(top_nodes)].copy()
+    top_codes = token_cat.cat.categories.get_indexer(top_nodes)
+    is_top = np.isin(codes, top_codes)
     
-    # Calculate co-occurrence (within same document)
-    cooc_dict = defaultdict(int)
+    # Calculate co-occurrence (within same document) on integer token codes
+    uniques, pair_codes, weights = _count_token_pairs(tokens_df['doc_id'][is_top], token_cat[is_top])
     
-    for doc_id, group in filtered_tokens.groupby('doc_id'):
-        tokens_in_doc = list(group['token'].unique())
-        
-        # Count pairs
-        for i, token1 in enumerate(tokens_in_doc):
-            for token2 in tokens_in_doc[i+1:]:
-                # Ensure consistent ordering
-                pair = tuple(sorted([token1, token2]))
-                cooc_dict[pair] += 1
-    
-    # Convert to DataFrame
-    edges = pd.DataFrame([
-        {'source': pair[0], 'target': pair[1], 'weight': count}
-        for pair, count in cooc_dict.items()
-    ])
-    
-    # Get top N edges by weight
-    if len(edges) > 0:
-        edges = edges.sort_values('weight', ascending=False).head(config.COOC_EDGE_TOP_N)
+    # Get top N edges by weight (partial selection, then order the survivors)
+    top_n = config.COOC_EDGE_TOP_N
+    if 0 < top_n < len(weights):
+        keep = np.argpartition(-weights, top_n - 1)[:top_n]
+        pair_codes, weights = pair_codes[keep], weights[keep]
+    order = np.argsort(-weights, kind='stable')[:max(top_n, 0)]
+    pair_codes, weights = pair_codes[order], weights[order]
+    
+    if len(weights) > 0:
+        n = len(uniques)
+        edges = pd.DataFrame({
+            'source': uniques[pair_codes // n],
+            'target': uniques[pair_codes % n],
+            'weight': weights
+        })
     else:
         edges = pd.DataFrame(columns=['source', 'target', 'weight'])
     
     # Create nodes table (only tokens that appear in edges)
     if len(edges) > 0:
         nodes_in_edges = set(edges['source']) | set(edges['target'])
-        nodes = doc_freq[doc_freq['token'].isin(nodes_in_edges)].copy()
+        nodes = doc_freq[doc_freq['token'].isin(nodes_in_edges)]
         nodes = nodes.sort_values('doc_freq', ascending=False)
     else:
         # No edges means no co-occurrence network
@@ -101,11 +234,6 @@ def calculate_cooccurrence(tokens_df: pd.DataFrame, config: Config, output_dir:
             f"This may happen if there are too few documents or tokens."
         )
     
-    # Save nodes (even if empty, so file exists for downstream processing)
-    nodes_path = output_dir / 'cooccurrence_nodes.csv'
-    nodes.to_csv(nodes_path, index=False)
-    
-    # Save edges (even if empty, so file exists for downstream processing)
-    edges_path = output_dir / 'cooccurrence_edges.csv'
-    edges.to_csv(edges_path, index=False)
+    # Save nodes and edges (even if empty, so files exist for downstream processing)
+    _save_network(nodes, edges, output_dir, config.COOC_OUTPUT_FORMAT)
 
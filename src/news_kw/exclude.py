@@ -0,0 +1,62 @@
+"""Exclude keyword loading shared by the pipeline and the lag analysis script."""
+
+import warnings
+from functools import lru_cache
+from pathlib import Path
+from typing import FrozenSet, Set
+
+
+@lru_cache(maxsize=8)
+def _load(exclude_dir_str: str, mtime_key: float) -> FrozenSet[str]:
+    """Read and parse all exclude keyword files in a directory.
+    
+    Args:
+        exclude_dir_str: Directory containing exclude keyword files
+        mtime_key: Latest modification time of the directory and its files
+            (only used to invalidate the cache when the files change)
+    
+    Returns:
+        Frozenset of exclude keywords (lowercased)
+    """
+    exclude_dir = Path(exclude_dir_str)
+    exclude_keywords: Set[str] = set()
+    
+    if not exclude_dir.exists():
+        return frozenset()
+    
+    # Read all .txt files in exclude directory
+    for txt_file in exclude_dir.glob('*.txt'):
+        try:
+            content = txt_file.read_text(encoding='utf-8', errors='replace')
+            # Split by comma and clean up (duplicates collapse as we go)
+            exclude_keywords.update(
+                kw.lower() for kw in map(str.strip, content.split(',')) if kw
+            )
+        except Exception as e:
+            warnings.warn(f"Error reading exclude file {txt_file}: {e}")
+    
+    return frozenset(exclude_keywords)
+
+
+def load_exclude_keywords(exclude_dir: Path) -> FrozenSet[str]:
+    """Load exclude keywords from data/exclude folder.
+    
+    Reads all .txt files in the exclude directory and extracts
+    comma-separated keywords from each file. Results are cached until
+    the directory or one of its .txt files is modified.
+    
+    Args:
+        exclude_dir: Directory containing exclude keyword files
+    
+    Returns:
+        Frozenset of exclude keywords (lowercased, deduplicated)
+    """
+    if not exclude_dir.exists():
+        return frozenset()
+    
+    mtime_key = max(
+        (p.stat().st_mtime for p in exclude_dir.glob('*.txt')),
+        default=0.0
+    )
+    mtime_key = max(mtime_key, exclude_dir.stat().st_mtime)
+    return _load(str(exclude_dir.resolve()), mtime_key)
@@ -1,16 +1,31 @@
 """Filter files by date parsing and copy to filtered_data directory as TXT."""
 
+import ctypes
+import importlib.util
 import os
 import sys
 import re
 import shutil
-import yaml
 from pathlib import Path
-from typing import List, Dict, Set, Optional, Tuple
+from typing import Callable, List, Dict, Set, Optional, Tuple
 import warnings
+from functools import lru_cache
 from tqdm import tqdm
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from news_kw.io import parse_date_from_path, parse_date_from_text, extract_text_from_html, extract_text_from_pdf, extract_text_from_docx_with_fallback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
+from news_kw.config import load_yaml_config
+from news_kw.io import (
+    PDF_SUPPORT,
+    extract_text_from_docx_with_fallback,
+    extract_text_from_html,
+    extract_text_from_pdf,
+    has_date_prefix,
+    iter_files,
+    parse_date_from_filename,
+    parse_date_from_path,
+    parse_date_from_text,
+    set_pdf_backend,
+)
 
 
 def check_conda_environment():
@@ -37,12 +52,6 @@ def check_conda_environment():
             UserWarning
         )
 
-try:
-    import pdfplumber
-    PDF_SUPPORT = True
-except ImportError:
-    PDF_SUPPORT = False
-
 try:
     from docx import Document
     DOCX_SUPPORT = True
@@ -50,13 +59,24 @@ except ImportError:
     DOCX_SUPPORT = False
 
 try:
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib.styles import getSampleStyleSheet
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-    REPORTLAB_SUPPORT = True
+    import ahocorasick
+    AHOCORASICK_SUPPORT = True
 except ImportError:
-    REPORTLAB_SUPPORT = False
-    warnings.warn("reportlab not available, text-to-PDF conversion will be limited")
+    AHOCORASICK_SUPPORT = False
+
+# reportlab is only used by the convert_*_to_pdf helpers, which the filter
+# pipeline (TXT output only) never calls, so it is imported on first use
+REPORTLAB_SUPPORT = importlib.util.find_spec('reportlab') is not None
+
+# Precompiled filename patterns (used once per file, so skip the re cache lookup)
+_NONWORD_RE = re.compile(r'[^\w\s-]')
+_MULTISEP_RE = re.compile(r'[\s_]+')
+_DATE_PREFIX_RE = re.compile(r'^(\d{4}-\d{2}-\d{2})_(.+?)\.txt$')
+_LINE_RE = re.compile(r'[^\n]+')
+
+# Windows long-path handling (260 character limit, 200 used as the threshold)
+_IS_WINDOWS = sys.platform == 'win32'
+_LONG_PATH_THRESHOLD = 200
 
 
 def validate_date_parsing(file_path: Path) -> Optional[str]:
@@ -91,41 +111,67 @@ def convert_text_to_pdf(text: str, output_pdf_path: Path, title: str = "Document
         warnings.warn("reportlab not available, cannot convert text to PDF")
         return False
     
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.utils import simpleSplit
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfgen import canvas
+    
     try:
-        # Use SimpleDocTemplate for better text handling
-        doc = SimpleDocTemplate(str(output_pdf_path), pagesize=A4,
-                              rightMargin=72, leftMargin=72,
-                              topMargin=72, bottomMargin=72)
-        
-        # Container for the 'Flowable' objects
-        story = []
-        styles = getSampleStyleSheet()
-        
-        # Split text into paragraphs and add to story
-        paragraphs = text.split('\n')
-        for para in paragraphs:
-            if para.strip():
-                # Replace special characters that might cause issues
-                para_clean = para.replace('\x00', '')  # Remove null bytes
-                try:
-                    story.append(Paragraph(para_clean[:5000], styles['Normal']))  # Limit paragraph length
-                    story.append(Spacer(1, 12))
-                except Exception:
-                    # If paragraph fails, try with escaped text
-                    try:
-                        import html
-                        para_escaped = html.escape(para_clean[:5000])
-                        story.append(Paragraph(para_escaped, styles['Normal']))
-                        story.append(Spacer(1, 12))
-                    except Exception:
-                        continue
-        
-        if not story:
+        # Draw lines straight onto a canvas (no flowables or paragraph parsing)
+        page_width, page_height = A4
+        margin = 72
+        font_name, font_size, leading = 'Helvetica', 10, 12
+        max_width = page_width - 2 * margin
+        lines_per_page = int((page_height - 2 * margin) // leading)
+        # Paragraphs this short fit on one line even in the widest glyph,
+        # so they skip the width measurement in simpleSplit
+        widest_char = max(pdfmetrics.getFont(font_name).widths) * font_size / 1000
+        max_unwrapped_chars = int(max_width // widest_char)
+        
+        pdf = canvas.Canvas(str(output_pdf_path), pagesize=A4)
+        pdf.setTitle(title)
+        
+        def new_text_object():
+            text_object = pdf.beginText(margin, page_height - margin)
+            text_object.setFont(font_name, font_size, leading)
+            return text_object
+        
+        text_object = new_text_object()
+        lines_on_page = 0
+        has_content = False
+        
+        # Iterate paragraphs lazily (null bytes removed once up front; empty lines never
+        # materialize), wrap each to the page width
+        for para_match in _LINE_RE.finditer(text.replace('\x00', '')):
+            para = para_match.group()
+            if not para.strip():
+                continue
+            # Limit paragraph length
+            para_clean = para[:5000]
+            if len(para_clean) <= max_unwrapped_chars:
+                # Same result as simpleSplit for a single line (whitespace collapsed)
+                lines = [' '.join(para_clean.split())]
+            else:
+                lines = simpleSplit(para_clean, font_name, font_size, max_width)
+            # Blank line between paragraphs
+            lines.append('')
+            for line in lines:
+                if lines_on_page >= lines_per_page:
+                    pdf.drawText(text_object)
+                    pdf.showPage()
+                    text_object = new_text_object()
+                    lines_on_page = 0
+                text_object.textLine(line)
+                lines_on_page += 1
+            has_content = True
+        
+        if not has_content:
             return False
         
-        # Build PDF
+        # Write PDF
         try:
-            doc.build(story)
+            pdf.drawText(text_object)
+            pdf.save()
             return True
         except Exception as e:
             warnings.warn(f"Error building PDF {output_pdf_path}: {e}")
@@ -183,9 +229,13 @@ def convert_txt_to_pdf(txt_path: Path, output_pdf_path: Path) -> bool:
         return False
 
 
+@lru_cache(maxsize=65536)
 def sanitize_filename(filename: str, max_length: int = 20) -> str:
     """Sanitize filename by removing special characters and limiting length.
     
+    Results are cached, since the same stems are sanitized both when copying
+    and when reverse-matching filtered files.
+    
     Args:
         filename: Original filename (without extension)
         max_length: Maximum length for filename (default: 20)
@@ -195,9 +245,9 @@ def sanitize_filename(filename: str, max_length: int = 20) -> str:
     """
     # Remove special characters (keep only alphanumeric, spaces, hyphens, underscores)
     # Replace special characters with underscore
-    sanitized = re.sub(r'[^\w\s-]', '_', filename)
+    sanitized = _NONWORD_RE.sub('_', filename)
     # Replace multiple spaces/underscores with single underscore
-    sanitized = re.sub(r'[\s_]+', '_', sanitized)
+    sanitized = _MULTISEP_RE.sub('_', sanitized)
     # Remove leading/trailing underscores
     sanitized = sanitized.strip('_')
     # Limit length
@@ -208,7 +258,75 @@ def sanitize_filename(filename: str, max_length: int = 20) -> str:
     return sanitized
 
 
-def find_original_file_from_filtered(filtered_file_path: Path, filtered_data_dir: Path, raw_txt_dir: Path) -> Optional[Path]:
+class RawFileIndex:
+    """Index of raw files by folder and parsed date for reverse lookups.
+    
+    Each raw folder is listed once, on first use, and its files are grouped
+    by the date parsed from their filename together with their sanitized
+    stem. Lookups for all filtered files in that folder then reuse it.
+    """
+    
+    # Extension order matches the original glob order, which decides ties
+    _EXTENSIONS = ('pdf', 'docx', 'txt', 'html', 'htm')
+    
+    def __init__(self, raw_txt_dir: Path):
+        """Create an empty index rooted at raw_txt_dir.
+        
+        Args:
+            raw_txt_dir: Root directory for raw files
+        """
+        self.raw_txt_dir = raw_txt_dir
+        self._folders: Dict[Path, Optional[Dict[Optional[str], List[Tuple[str, str]]]]] = {}
+    
+    def candidates(self, folder_path: Path, parsed_date: str) -> Optional[List[Tuple[str, str]]]:
+        """Get raw files in a folder whose filename parses to the given date.
+        
+        Args:
+            folder_path: Folder relative to raw_txt_dir (e.g., reddit/2021)
+            parsed_date: Date in YYYY-MM-DD format
+            
+        Returns:
+            List of (raw_file_path_str, sanitized_stem) tuples in listing
+            order, or None if the folder does not exist
+        """
+        if folder_path not in self._folders:
+            self._folders[folder_path] = self._build(self.raw_txt_dir / folder_path)
+        by_date = self._folders[folder_path]
+        if by_date is None:
+            return None
+        return by_date.get(parsed_date, [])
+    
+    def _build(self, raw_folder: Path) -> Optional[Dict[Optional[str], List[Tuple[str, str]]]]:
+        """List a raw folder once and group its files by parsed date."""
+        # Single directory read; DirEntry.is_file() uses the cached entry type,
+        # and names/paths stay strings (Path is only built for a returned match).
+        # Paths are joined onto str(raw_folder) so they read exactly like str(Path)
+        folder_str = str(raw_folder)
+        by_ext: Dict[str, List[Tuple[str, str]]] = {ext: [] for ext in self._EXTENSIONS}
+        try:
+            with os.scandir(raw_folder) as entries:
+                for entry in entries:
+                    name = entry.name
+                    # Case-sensitive like the raw_folder.glob('*.<ext>') calls
+                    _, dot, ext = name.rpartition('.')
+                    bucket = by_ext.get(ext) if dot else None
+                    if bucket is not None and entry.is_file(follow_symlinks=False):
+                        bucket.append((_join_root(folder_str, name), name))
+        except OSError:
+            return None
+        
+        by_date: Dict[Optional[str], List[Tuple[str, str]]] = {}
+        for ext in self._EXTENSIONS:
+            for path_str, name in by_ext[ext]:
+                stem = name[:-(len(ext) + 1)] or name
+                by_date.setdefault(parse_date_from_filename(name), []).append(
+                    (path_str, sanitize_filename(stem, max_length=1000))
+                )
+        return by_date
+
+
+def find_original_file_from_filtered(filtered_file_path: Path, filtered_data_dir: Path, raw_txt_dir: Path,
+                                     raw_index: Optional[RawFileIndex] = None) -> Optional[Path]:
     """Find the original file in raw_txt_dir that corresponds to a filtered_data file.
     
     This function reverses the sanitization process to find the original file.
@@ -217,20 +335,13 @@ def find_original_file_from_filtered(filtered_file_path: Path, filtered_data_dir
         filtered_file_path: Path to file in filtered_data (e.g., YYYY-MM-DD_sanitized_name.txt)
         filtered_data_dir: Root directory for filtered files
         raw_txt_dir: Root directory for raw files
+        raw_index: Shared index of raw_txt_dir; pass one in when looking up
+            many files so each raw folder is only listed once
         
     Returns:
         Original file path in raw_txt_dir, or None if not found
     """
     try:
-        # Extract date prefix and sanitized stem from filtered filename
-        # Format: YYYY-MM-DD_sanitized_stem.txt
-        filename = filtered_file_path.name
-        date_prefix_match = re.match(r'^(\d{4}-\d{2}-\d{2})_(.+?)\.txt$', filename)
-        if not date_prefix_match:
-            return None
-        
-        parsed_date, sanitized_stem = date_prefix_match.groups()
-        
         # Get relative path from filtered_data_dir
         # filtered_file_path is like: data/filtered_data/reddit/2021/YYYY-MM-DD_name.txt
         # We need: reddit/2021/
@@ -246,68 +357,212 @@ def find_original_file_from_filtered(filtered_file_path: Path, filtered_data_dir
             else:
                 return None
         
-        # Look for original files in the corresponding raw_txt directory
-        raw_folder = raw_txt_dir / folder_path
-        if not raw_folder.exists():
+        if raw_index is None:
+            raw_index = RawFileIndex(raw_txt_dir)
+        original_file_str = _find_original_path_str(filtered_file_path.name, folder_path, raw_index)
+        return Path(original_file_str) if original_file_str is not None else None
+    except Exception:
+        return None
+
+
+def _find_original_path_str(filename: str, folder_path: Path, raw_index: RawFileIndex) -> Optional[str]:
+    """Match a filtered filename against the raw files of its folder.
+    
+    String-level core of find_original_file_from_filtered, for callers that
+    already have the filename and folder and want a path string back.
+    
+    Args:
+        filename: Filtered filename (e.g., YYYY-MM-DD_sanitized_name.txt)
+        folder_path: Folder relative to both roots (e.g., reddit/2021)
+        raw_index: Index of raw_txt_dir
+        
+    Returns:
+        Original file path string in raw_txt_dir, or None if not found
+    """
+    try:
+        # Extract date prefix and sanitized stem from filtered filename
+        # Format: YYYY-MM-DD_sanitized_stem.txt
+        date_prefix_match = _DATE_PREFIX_RE.match(filename)
+        if not date_prefix_match:
             return None
         
-        # Find files in raw_txt that could match
-        # We need to check if sanitizing the original filename would match sanitized_stem
-        # Use glob() instead of iterdir() to handle very long filenames on Windows
-        from news_kw.io import parse_date_from_path
-        
-        candidates_by_date = []  # Store files with matching date as fallback
-        # Try multiple file patterns to catch all files (PDF, DOCX, TXT, etc.)
-        raw_files = list(raw_folder.glob('*.pdf')) + list(raw_folder.glob('*.docx')) + list(raw_folder.glob('*.txt')) + list(raw_folder.glob('*.html')) + list(raw_folder.glob('*.htm'))
-        for raw_file in raw_files:
-            if raw_file.is_file():
-                # First, verify the date matches (this is the most important check)
-                parsed_date_from_file = parse_date_from_path(raw_file)
-                if parsed_date_from_file != parsed_date:
-                    continue
-                
-                # Date matches, store as candidate
-                candidates_by_date.append(raw_file)
-                
-                # Try filename matching
-                original_stem = raw_file.stem
-                # Sanitize original stem and compare
-                sanitized_original = sanitize_filename(original_stem, max_length=1000)
-                
-                # Check if sanitized versions match (allowing for truncation)
-                # Since sanitized_stem might be truncated, check if it's a prefix or matches
-                # Also check reverse: sanitized_stem might be longer if original was truncated
-                if (sanitized_stem == sanitized_original or 
-                    sanitized_original.startswith(sanitized_stem) or 
-                    sanitized_stem.startswith(sanitized_original)):
-                    # Filename and date both match - this is the best match
-                    return raw_file
+        parsed_date, sanitized_stem = date_prefix_match.groups()
+        
+        # Look for original files with a matching date in the corresponding raw_txt directory
+        candidates_by_date = raw_index.candidates(folder_path, parsed_date)
+        if candidates_by_date is None:
+            return None
+        
+        # Check if sanitizing the original filename would match sanitized_stem
+        for raw_file, sanitized_original in candidates_by_date:
+            # Check if sanitized versions match (allowing for truncation)
+            # Since sanitized_stem might be truncated, check if it's a prefix or matches
+            # Also check reverse: sanitized_stem might be longer if original was truncated
+            if (sanitized_stem == sanitized_original or 
+                sanitized_original.startswith(sanitized_stem) or 
+                sanitized_stem.startswith(sanitized_original)):
+                # Filename and date both match - this is the best match
+                return raw_file
         
         # If filename matching failed but we have candidates with matching dates,
         # use the best candidate (prefer files that have at least some common prefix)
         if candidates_by_date:
             # If there's only one candidate with matching date, use it
             if len(candidates_by_date) == 1:
-                return candidates_by_date[0]
+                return candidates_by_date[0][0]
             
             # If multiple candidates, try to find the best match by checking prefix
             # (even if truncated, the prefix should match)
-            sanitized_stem_lower = sanitized_stem.lower()
-            for candidate in candidates_by_date:
-                candidate_stem = candidate.stem
-                sanitized_candidate = sanitize_filename(candidate_stem, max_length=1000).lower()
+            stem_prefix = sanitized_stem.lower()[:20]
+            for candidate, sanitized_candidate in candidates_by_date:
                 # Check if the first part of sanitized_stem matches the beginning of sanitized_candidate
-                if sanitized_stem_lower and sanitized_candidate.startswith(sanitized_stem_lower[:min(20, len(sanitized_stem_lower))]):
+                if stem_prefix and sanitized_candidate.lower().startswith(stem_prefix):
                     return candidate
             
             # If no prefix match, return the first candidate (better than nothing)
-            return candidates_by_date[0]
+            return candidates_by_date[0][0]
         
         return None
     except Exception:
         return None
 
 
+def _collect_raw_files(raw_txt_dir: Path, exclude_folders: List[str],
+                       source_folders: Optional[Set[str]] = None) -> List[str]:
+    """Find all supported files under raw_txt_dir in a single directory walk.
+    
+    Subdirectories whose name contains an excluded folder name are pruned
+    instead of being walked, since every file below them would be excluded.
+    
+    Args:
+        raw_txt_dir: Directory containing raw files
+        exclude_folders: Folder names (or name fragments) to skip
+        source_folders: If given, only these top-level folders are walked
+        
+    Returns:
+        List of file paths relative to raw_txt_dir (plain strings, so callers
+        only build Path objects for files they keep), grouped by type
+        (TXT, PDF, HTML, HTM, DOCX)
+    """
+    # Extensions are case-sensitive as in the original per-extension globs,
+    # where .DOCX was the only upper-case variant picked up
+    extensions = ('txt', 'pdf', 'html', 'htm', 'docx', 'DOCX')
+    if not PDF_SUPPORT:
+        extensions = tuple(ext for ext in extensions if ext != 'pdf')
+    by_ext: Dict[str, List[str]] = {ext: [] for ext in extensions}
+    root = os.fspath(raw_txt_dir)
+    
+    # One compiled matcher for all exclude names instead of a loop per directory
+    # (an empty name is contained in every directory name)
+    folder_match = _compile_substring_matcher(exclude_folders)
+    prune_all = '' in exclude_folders
+    
+    for dirpath, dirnames, filenames in os.walk(root):
+        # os.walk joins onto root, so the relative part is a plain slice
+        rel_dir = dirpath[len(root):].lstrip(os.sep)
+        if not rel_dir and source_folders is not None:
+            # Top-level entries outside the source folders are never used
+            dirnames[:] = [d for d in dirnames if d in source_folders]
+            filenames = [name for name in filenames if name in source_folders]
+        if prune_all:
+            dirnames[:] = []
+        elif folder_match is not None:
+            dirnames[:] = [d for d in dirnames if not folder_match(d)]
+        for name in filenames:
+            _, dot, ext = name.rpartition('.')
+            bucket = by_ext.get(ext) if dot else None
+            if bucket is not None:
+                bucket.append(rel_dir + os.sep + name if rel_dir else name)
+    
+    return [rel_path for ext in extensions for rel_path in by_ext[ext]]
+
+
+def _compile_substring_matcher(substrings: List[str]) -> Optional[Callable[[str], bool]]:
+    """Compile substrings into one matcher so a path is scanned once.
+    
+    Uses an Aho-Corasick automaton when pyahocorasick is installed (one pass
+    regardless of the number of substrings), otherwise a regex alternation.
+    
+    Args:
+        substrings: Literal substrings to look for
+        
+    Returns:
+        Function returning True if the text contains any of the substrings,
+        or None if there are no (non-empty) substrings
+    """
+    substrings = [sub for sub in substrings if sub]
+    if not substrings:
+        return None
+    
+    if AHOCORASICK_SUPPORT:
+        automaton = ahocorasick.Automaton()
+        for sub in substrings:
+            automaton.add_word(sub, sub)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    
+    pattern = re.compile('|'.join(map(re.escape, substrings)))
+    return lambda text: pattern.search(text) is not None
+
+
+def _compile_prefix_matcher(prefixes: List[str]) -> Optional[Callable[[str], bool]]:
+    """Compile prefixes into a matcher keyed by first character.
+    
+    A one-level trie: each name is only compared against the prefixes that
+    share its first character, so the cost stays flat as the list grows.
+    
+    Args:
+        prefixes: Literal prefixes to look for
+        
+    Returns:
+        Function returning True if the text starts with any of the prefixes,
+        or None if there are no prefixes
+    """
+    if not prefixes:
+        return None
+    if '' in prefixes:
+        return lambda text: True
+    
+    by_first: Dict[str, List[str]] = {}
+    for prefix in prefixes:
+        by_first.setdefault(prefix[0], []).append(prefix)
+    buckets = {first: tuple(group) for first, group in by_first.items()}
+    
+    def match(text: str) -> bool:
+        bucket = buckets.get(text[:1])
+        return bucket is not None and text.startswith(bucket)
+    
+    return match
+
+
+def _build_exclude_matcher(exclude_folders: List[str], exclude_files: List[str],
+                           exclude_path_patterns: List[str]) -> Callable[[str, str, str], bool]:
+    """Build a predicate applying the EXCLUDE_* rules from the config.
+    
+    Args:
+        exclude_folders: Folder names (or name fragments) to exclude
+        exclude_files: File name prefixes to exclude
+        exclude_path_patterns: Path fragments to exclude
+        
+    Returns:
+        Function (folder_text, path_text, file_name) -> True if excluded, where
+        folder_text is searched for exclude_folders and path_text for
+        exclude_path_patterns
+    """
+    folder_match = _compile_substring_matcher(exclude_folders)
+    path_match = _compile_substring_matcher(exclude_path_patterns)
+    file_match = _compile_prefix_matcher(exclude_files)
+    match_all = '' in exclude_folders or '' in exclude_path_patterns
+    
+    def is_excluded(folder_text: str, path_text: str, file_name: str) -> bool:
+        return (match_all or
+                (folder_match is not None and folder_match(folder_text)) or
+                (path_match is not None and path_match(path_text)) or
+                (file_match is not None and file_match(file_name)))
+    
+    return is_excluded
+
+
 def has_new_files(raw_txt_dir: Path, filtered_data_dir: Path, config_path: Path) -> bool:
     """Check if there are new files in raw_txt that haven't been processed to filtered_data.
     
@@ -326,8 +581,7 @@ def has_new_files(raw_txt_dir: Path, filtered_data_dir: Path, config_path: Path)
         return True  # If filtered_data doesn't exist, we need to process
     
     # Load config
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
+    config = load_yaml_config(config_path)
     
     data_source_groups = config.get('DATA_SOURCE_GROUPS', [])
     exclude_folders = config.get('EXCLUDE_FOLDERS', ['_files'])
@@ -342,38 +596,25 @@ def has_new_files(raw_txt_dir: Path, filtered_data_dir: Path, config_path: Path)
         else:
             all_folders.add(group)
     
+    is_excluded = _build_exclude_matcher(exclude_folders, exclude_files, exclude_path_patterns)
+    
     # Find all files in raw_txt_dir
-    txt_files = list(raw_txt_dir.rglob('*.txt'))
-    pdf_files = list(raw_txt_dir.rglob('*.pdf')) if PDF_SUPPORT else []
-    html_files = list(raw_txt_dir.rglob('*.html')) + list(raw_txt_dir.rglob('*.htm'))
-    docx_files = list(raw_txt_dir.rglob('*.docx')) + list(raw_txt_dir.rglob('*.DOCX'))
-    all_files = txt_files + pdf_files + html_files + docx_files
+    all_files = _collect_raw_files(raw_txt_dir, exclude_folders, all_folders)
     
     # Check each file
-    for file_path in all_files:
+    raw_root = str(raw_txt_dir)
+    for rel_path_str in all_files:
         try:
-            rel_path = file_path.relative_to(raw_txt_dir)
-            first_folder = rel_path.parts[0] if rel_path.parts else None
-            
             # Skip if not in source folders
-            if first_folder not in all_folders:
+            if rel_path_str.split(os.sep, 1)[0] not in all_folders:
                 continue
             
-            # Check exclude rules
-            file_path_str = str(file_path)
-            file_name = file_path.name
-            
-            # Check excluded folders
-            if any(folder_name in file_path_str for folder_name in exclude_folders):
+            # Check exclude rules (folders, path patterns, file prefixes)
+            file_path_str = raw_root + os.sep + rel_path_str
+            if is_excluded(file_path_str, file_path_str, rel_path_str.rpartition(os.sep)[2]):
                 continue
             
-            # Check excluded path patterns
-            if any(pattern in file_path_str for pattern in exclude_path_patterns):
-                continue
-            
-            # Check excluded files
-            if any(file_name.startswith(prefix) for prefix in exclude_files):
-                continue
+            file_path = raw_txt_dir / rel_path_str
             
             # Validate date parsing
             parsed_date = validate_date_parsing(file_path)
@@ -406,8 +647,16 @@ def create_destination_filename(source_path: Path, parsed_date: str, raw_txt_dir
     Returns:
         Destination path with date prefix
     """
-    # Get relative path from raw_txt_dir
-    rel_path = source_path.relative_to(raw_txt_dir)
+    # Get relative folder from raw_txt_dir (string slicing; relative_to is only
+    # needed for unusual paths and raises ValueError outside raw_txt_dir as before)
+    source_path_str = str(source_path)
+    raw_root = str(raw_txt_dir) + os.sep
+    if source_path_str.startswith(raw_root):
+        rel_dir = os.path.dirname(source_path_str[len(raw_root):])
+    else:
+        rel_dir = str(source_path.relative_to(raw_txt_dir).parent)
+        if rel_dir == '.':
+            rel_dir = ''
     
     # Get original filename without extension
     original_stem = source_path.stem
@@ -420,11 +669,11 @@ def create_destination_filename(source_path: Path, parsed_date: str, raw_txt_dir
     
     # Create destination path maintaining folder structure
     # Use the same folder structure but with new filename
-    dest_path = filtered_data_dir / rel_path.parent / new_filename
+    dest_dir_str = str(filtered_data_dir) + os.sep + rel_dir if rel_dir else str(filtered_data_dir)
+    dest_path_str = dest_dir_str + os.sep + new_filename
     
     # Check if total path length is too long (Windows 260 char limit, but we'll use 200 as threshold)
-    dest_path_str = str(dest_path)
-    if len(dest_path_str) > 200:
+    if len(dest_path_str) > _LONG_PATH_THRESHOLD:
         # Truncate filename to 50 characters (keeping extension)
         # Format: YYYY-MM-DD_ (11 chars) + filename (50 chars) + .txt (4 chars) = 65 chars max for filename part
         # But we need to account for folder path, so use 50 chars for the stem part
@@ -434,30 +683,92 @@ def create_destination_filename(source_path: Path, parsed_date: str, raw_txt_dir
         
         # Recreate filename with truncated stem
         new_filename = f"{parsed_date}_{sanitized_stem}.txt"
-        dest_path = filtered_data_dir / rel_path.parent / new_filename
+        dest_path_str = dest_dir_str + os.sep + new_filename
         
         # If still too long, truncate more aggressively
-        dest_path_str = str(dest_path)
-        if len(dest_path_str) > 200:
+        if len(dest_path_str) > _LONG_PATH_THRESHOLD:
             # Calculate available length for filename
-            base_path_len = len(str(filtered_data_dir / rel_path.parent)) + 1  # +1 for separator
-            available_for_filename = 200 - base_path_len - 1  # -1 for safety margin
+            base_path_len = len(dest_dir_str) + 1  # +1 for separator
+            available_for_filename = _LONG_PATH_THRESHOLD - base_path_len - 1  # -1 for safety margin
             if available_for_filename > 15:  # At least YYYY-MM-DD_ (11) + some chars + .txt (4)
                 max_stem_length = available_for_filename - 15  # 11 (date) + 4 (ext) = 15
                 if max_stem_length > 0:
                     sanitized_stem = sanitized_stem[:max_stem_length]
                     new_filename = f"{parsed_date}_{sanitized_stem}.txt"
-                    dest_path = filtered_data_dir / rel_path.parent / new_filename
+                    dest_path_str = dest_dir_str + os.sep + new_filename
+    
+    return Path(dest_path_str)
+
+
+def _long_path(path: Path) -> str:
+    """Get the \\\\?\\ prefixed form of a path for Windows long-path APIs.
+    
+    Uses os.path.abspath (pure string handling) rather than Path.resolve(),
+    which costs a filesystem call per file.
+    
+    Args:
+        path: File or directory path
+        
+    Returns:
+        Absolute path string with the \\\\?\\ prefix
+    """
+    return '\\\\?\\' + os.path.abspath(path)
+
+
+def _copy_file(source: str, dest: str) -> None:
+    """Copy a file in kernel space, keeping its timestamps (like shutil.copy2).
     
-    return dest_path
+    Uses CopyFileW on Windows and os.sendfile on Linux, skipping the extra
+    stat calls shutil makes before copying. Other platforms use shutil.copy2.
+    
+    Args:
+        source: Source file path
+        dest: Destination file path (overwritten if it exists)
+    """
+    if _IS_WINDOWS:
+        if not ctypes.windll.kernel32.CopyFileW(source, dest, False):
+            raise ctypes.WinError()
+    elif sys.platform.startswith('linux'):
+        with open(source, 'rb') as src, open(dest, 'wb') as dst:
+            stat = os.fstat(src.fileno())
+            offset = 0
+            while offset < stat.st_size:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, stat.st_size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            os.utime(dst.fileno(), ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    else:
+        shutil.copy2(source, dest)
+
 
+def _write_text_file(path_str: str, text: str) -> None:
+    """Write text as UTF-8 straight to a file descriptor.
+    
+    Encodes once and skips the TextIOWrapper buffer, so only the encoded
+    bytes are held alongside the text.
+    
+    Args:
+        path_str: Destination file path
+        text: Text to write (unencodable characters are dropped)
+    """
+    data = memoryview(text.encode('utf-8', errors='ignore'))
+    fd = os.open(path_str, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
-def convert_file_to_txt(source_path: Path, dest_txt_path: Path) -> bool:
+
+def convert_file_to_txt(source_path: Path, dest_txt_path: Path, create_parent: bool = True) -> bool:
     """Extract text from any file and save as TXT format.
     
     Args:
         source_path: Path to source file (PDF, DOCX, HTML, TXT)
         dest_txt_path: Path to save TXT file
+        create_parent: Create the destination directory if needed (callers that
+            already created all destination directories can skip it)
         
     Returns:
         True if conversion successful, False otherwise
@@ -467,12 +778,10 @@ def convert_file_to_txt(source_path: Path, dest_txt_path: Path) -> bool:
     file_exists = False
     if source_path.exists():
         file_exists = True
-    elif sys.platform == 'win32':
+    elif _IS_WINDOWS:
         # Try with long path prefix for Windows
         try:
-            abs_path = source_path.resolve()
-            long_path = '\\\\?\\' + str(abs_path)
-            file_exists = os.path.exists(long_path)
+            file_exists = os.path.exists(_long_path(source_path))
         except Exception:
             file_exists = False
     
@@ -490,48 +799,46 @@ def convert_file_to_txt(source_path: Path, dest_txt_path: Path) -> bool:
         try:
             # Check path length (Windows 260 character limit)
             # Use long path prefix for both source and destination if needed
-            dest_path_str = str(dest_txt_path)
-            source_path_str = str(source_path)
-            use_long_path = (len(dest_path_str) > 200 or len(source_path_str) > 200) and sys.platform == 'win32'
+            use_long_path = _IS_WINDOWS and (len(str(dest_txt_path)) > _LONG_PATH_THRESHOLD or
+                                             len(str(source_path)) > _LONG_PATH_THRESHOLD)
             
             if use_long_path:
                 # Use \\?\ prefix for long paths (Windows)
                 try:
-                    abs_dest = dest_txt_path.resolve()
-                    abs_source = source_path.resolve()
-                    long_dest = '\\\\?\\' + str(abs_dest)
-                    long_source = '\\\\?\\' + str(abs_source)
+                    long_dest = _long_path(dest_txt_path)
+                    long_source = _long_path(source_path)
                     
                     # Create destination directory using long path
                     # Extract directory from long_dest string
-                    dest_dir = os.path.dirname(long_dest)
-                    try:
-                        os.makedirs(dest_dir, exist_ok=True)
-                    except Exception as dir_error:
-                        warnings.warn(f"Cannot create directory for TXT {source_path.name}: {dir_error}")
-                        return False
+                    if create_parent:
+                        try:
+                            os.makedirs(os.path.dirname(long_dest), exist_ok=True)
+                        except Exception as dir_error:
+                            warnings.warn(f"Cannot create directory for TXT {source_path.name}: {dir_error}")
+                            return False
                     
                     # Copy using long paths
-                    shutil.copy2(long_source, long_dest)
+                    _copy_file(long_source, long_dest)
                     return True
                 except Exception as long_path_error:
                     warnings.warn(f"Long path copy failed for {source_path.name}: {long_path_error}")
                     return False
             else:
                 # Normal path handling
-                try:
-                    dest_txt_path.parent.mkdir(parents=True, exist_ok=True)
-                except OSError as dir_error:
-                    # If directory creation fails, try creating one level at a time
+                if create_parent:
                     try:
-                        parent = dest_txt_path.parent
-                        parent.mkdir(parents=True, exist_ok=True)
-                    except Exception:
-                        error_msg = f"Cannot create directory for TXT {source_path.name}: {dir_error}"
-                        warnings.warn(error_msg)
-                        return False
+                        dest_txt_path.parent.mkdir(parents=True, exist_ok=True)
+                    except OSError as dir_error:
+                        # If directory creation fails, try creating one level at a time
+                        try:
+                            parent = dest_txt_path.parent
+                            parent.mkdir(parents=True, exist_ok=True)
+                        except Exception:
+                            error_msg = f"Cannot create directory for TXT {source_path.name}: {dir_error}"
+                            warnings.warn(error_msg)
+                            return False
                 
-                shutil.copy2(source_path, dest_txt_path)
+                _copy_file(str(source_path), str(dest_txt_path))
                 return True
         except OSError as e:
             # Handle path length or permission issues
@@ -575,9 +882,13 @@ def convert_file_to_txt(source_path: Path, dest_txt_path: Path) -> bool:
     # Save extracted text to TXT file
     if text:
         try:
-            dest_txt_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(dest_txt_path, 'w', encoding='utf-8', errors='ignore') as f:
-                f.write(text)
+            if create_parent:
+                dest_txt_path.parent.mkdir(parents=True, exist_ok=True)
+            dest_path_str = str(dest_txt_path)
+            if _IS_WINDOWS and len(dest_path_str) > _LONG_PATH_THRESHOLD:
+                # Use \\?\ prefix for long paths (Windows)
+                dest_path_str = _long_path(dest_txt_path)
+            _write_text_file(dest_path_str, text)
             return True
         except Exception as e:
             warnings.warn(f"Error saving text to TXT {source_path.name}: {type(e).__name__}: {e}")
@@ -586,37 +897,66 @@ def convert_file_to_txt(source_path: Path, dest_txt_path: Path) -> bool:
     return False
 
 
-def _process_single_file_for_filter(args: Tuple[Path, Path, Path]) -> Tuple[Optional[str], Optional[str]]:
+# Raw/filtered root directories for worker tasks, set once per worker by
+# _init_filter_worker so each task only carries relative paths
+_WORKER_ROOTS: Tuple[str, str] = ('.', '.')
+
+
+def _init_filter_worker(raw_root: str, filtered_root: str, pdf_backend: Optional[str] = None) -> None:
+    """Executor initializer storing the root directories in the worker.
+    
+    Args:
+        raw_root: Root directory for raw files
+        filtered_root: Root directory for filtered files
+        pdf_backend: PDF text backend selected in the parent process (only
+            needed for worker processes)
+    """
+    global _WORKER_ROOTS
+    _WORKER_ROOTS = (raw_root, filtered_root)
+    if pdf_backend is not None:
+        set_pdf_backend(pdf_backend)
+
+
+def _join_root(root: str, rel_path: str) -> str:
+    """Join a root directory string and a relative path the way pathlib would.
+    
+    Args:
+        root: Root directory (str() of a Path)
+        rel_path: Path relative to root
+        
+    Returns:
+        Joined path string
+    """
+    if root == '.':
+        return rel_path
+    return root.rstrip(os.sep) + os.sep + rel_path
+
+
+def _process_single_file_for_filter(args: Tuple[str, str]) -> Tuple[Optional[str], Optional[str]]:
     """Process a single file for filtering and conversion.
     
-    This function is designed to be used with ProcessPoolExecutor.
-    It processes one file: validates date parsing and converts to TXT.
+    This function is designed to be used with ProcessPoolExecutor (or
+    ThreadPoolExecutor for plain TXT copies), initialized with
+    _init_filter_worker.
+    It processes one file whose destination (and its directory) was already
+    prepared: converts it to TXT.
     
     Args:
-        args: Tuple of (file_path, raw_txt_dir, filtered_data_dir)
+        args: Tuple of (file_path, dest_path) relative to the raw and
+            filtered roots
         
     Returns:
         Tuple of (success_file_path, error_message)
         - If successful: (file_path_str, None)
         - If failed: (None, error_message)
     """
-    file_path, raw_txt_dir, filtered_data_dir = args
+    raw_root, filtered_root = _WORKER_ROOTS
+    file_path = Path(_join_root(raw_root, args[0]))
+    dest_path = Path(_join_root(filtered_root, args[1]))
     
     try:
-        # Validate date parsing
-        parsed_date = validate_date_parsing(file_path)
-        
-        if parsed_date is None:
-            return (None, str(file_path))
-        
-        # Create destination filename with date prefix and sanitized name
-        dest_path = create_destination_filename(file_path, parsed_date, raw_txt_dir, filtered_data_dir)
-        
-        # Create parent directories (mkdir with exist_ok=True is thread-safe)
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        
         # Convert file to TXT (or copy if already TXT)
-        if not convert_file_to_txt(file_path, dest_path):
+        if not convert_file_to_txt(file_path, dest_path, create_parent=False):
             # Try to get more specific error information
             if not file_path.exists():
                 return (None, f"{str(file_path)} (File not found)")
@@ -644,8 +984,7 @@ def filter_and_copy_files(raw_txt_dir: Path, filtered_data_dir: Path,
     filtered_data_dir.mkdir(parents=True, exist_ok=True)
     
     # Load config
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
+    config = load_yaml_config(config_path)
     
     data_source_groups = config.get('DATA_SOURCE_GROUPS', [])
     
@@ -654,6 +993,12 @@ def filter_and_copy_files(raw_txt_dir: Path, filtered_data_dir: Path,
     exclude_files = config.get('EXCLUDE_FILES', ['fig_', '~$'])
     exclude_path_patterns = config.get('EXCLUDE_PATH_PATTERNS', [])
     
+    # Pin the PDF text backend so converted text does not depend on which
+    # optional packages happen to be installed
+    pdf_backend = set_pdf_backend(config.get('PDF_BACKEND', 'pdfplumber'))
+    if PDF_SUPPORT:
+        print(f"PDF text backend: {pdf_backend}")
+    
     # Collect all unique folder names from groups
     all_folders: Set[str] = set()
     for group in data_source_groups:
@@ -663,102 +1008,120 @@ def filter_and_copy_files(raw_txt_dir: Path, filtered_data_dir: Path,
             all_folders.add(group)
     
     # Find all files in raw_txt_dir
-    txt_files = list(raw_txt_dir.rglob('*.txt'))
-    pdf_files = list(raw_txt_dir.rglob('*.pdf')) if PDF_SUPPORT else []
-    html_files = list(raw_txt_dir.rglob('*.html')) + list(raw_txt_dir.rglob('*.htm'))
-    docx_files = list(raw_txt_dir.rglob('*.docx')) + list(raw_txt_dir.rglob('*.DOCX'))
+    all_files = _collect_raw_files(raw_txt_dir, exclude_folders, all_folders)
     
-    all_files = txt_files + pdf_files + html_files + docx_files
+    is_excluded = _build_exclude_matcher(exclude_folders, exclude_files, exclude_path_patterns)
     
     # Filter files by source folders and exclude unwanted files
-    filtered_files = []
-    for file_path in all_files:
-        try:
-            rel_path = file_path.relative_to(raw_txt_dir)
-            first_folder = rel_path.parts[0] if rel_path.parts else None
-            
-            # Skip if not in source folders
-            if first_folder not in all_folders:
-                continue
-            
-            # Check exclude folders from config (check if folder name appears in path parts or folder names contain it)
-            should_exclude = False
-            for folder_name in exclude_folders:
-                # Check if folder name is exactly in path parts
-                if folder_name in rel_path.parts:
-                    should_exclude = True
-                    break
-                # Check if any folder name contains the exclude pattern
-                for part in rel_path.parts:
-                    if folder_name in part:
-                        should_exclude = True
-                        break
-                if should_exclude:
-                    break
-            
-            # Check exclude path patterns from config (check if pattern appears in relative path string)
-            if not should_exclude:
-                rel_path_str = str(rel_path)
-                for pattern in exclude_path_patterns:
-                    if pattern in rel_path_str:
-                        should_exclude = True
-                        break
-            
-            # Check exclude files from config (check if file name starts with excluded prefix)
-            if not should_exclude:
-                file_name = file_path.name
-                for file_prefix in exclude_files:
-                    if file_name.startswith(file_prefix):
-                        should_exclude = True
-                        break
-            
-            if should_exclude:
-                continue
-            
-            filtered_files.append(file_path)
-        except ValueError:
+    # (also remembers the relative paths for the raw vs filtered comparison below)
+    filtered_rel_paths: List[str] = []
+    raw_txt_files_after_exclude = set()
+    for rel_path_str in all_files:
+        rel_parts = rel_path_str.split(os.sep)
+        
+        # Skip if not in source folders
+        if rel_parts[0] not in all_folders:
             continue
+        
+        # Exclude folders match any path part containing the name (NUL never occurs
+        # in paths, so joining keeps matches within a single part), path patterns
+        # match the relative path string, and file exclusions match name prefixes
+        if is_excluded('\0'.join(rel_parts), rel_path_str, rel_parts[-1]):
+            continue
+        
+        filtered_rel_paths.append(rel_path_str)
+        raw_txt_files_after_exclude.add(rel_path_str)
     
     # Validate dates and copy files
     successful_files = []
     failed_files = []
     failed_date_parsing = []  # Files that failed date parsing (filename only)
     
-    num_files = len(filtered_files)
+    num_files = len(filtered_rel_paths)
     print(f"Processing {num_files} files...")
     
+    # Parse dates and plan destinations once up front (filename only, no content
+    # reading); files without a date in their filename never reach the workers.
+    # Records are kept as parallel lists of paths relative to the raw/filtered
+    # roots (plain strings pickle far cheaper than Path objects), and the roots
+    # are handed to each worker once through the executor initializer.
+    raw_root = str(raw_txt_dir)
+    filtered_root = str(filtered_data_dir)
+    filtered_prefix = _join_root(filtered_root, '')
+    source_paths: List[str] = []
+    dest_paths: List[str] = []
+    is_txt: List[bool] = []
+    dest_dirs: Set[str] = set()
+    for rel_path_str in filtered_rel_paths:
+        file_path = Path(_join_root(raw_root, rel_path_str))
+        parsed_date = validate_date_parsing(file_path)
+        if parsed_date is None:
+            failed_files.append(str(file_path))
+            failed_date_parsing.append(str(file_path))
+            continue
+        try:
+            # Create destination filename with date prefix and sanitized name
+            dest_path = create_destination_filename(file_path, parsed_date, raw_txt_dir, filtered_data_dir)
+        except Exception as e:
+            failed_files.append(f"{str(file_path)} (Error: {str(e)})")
+            continue
+        dest_path_str = str(dest_path)
+        source_paths.append(rel_path_str)
+        dest_paths.append(dest_path_str[len(filtered_prefix):])
+        is_txt.append(rel_path_str.rpartition('.')[2].lower() == 'txt')
+        dest_dirs.add(os.path.dirname(dest_path_str))
+    
+    # Create each destination directory once instead of once per file
+    for dest_dir in dest_dirs:
+        try:
+            if _IS_WINDOWS and len(dest_dir) > _LONG_PATH_THRESHOLD:
+                os.makedirs(_long_path(Path(dest_dir)), exist_ok=True)
+            else:
+                os.makedirs(dest_dir, exist_ok=True)
+        except OSError as e:
+            warnings.warn(f"Cannot create directory {dest_dir}: {e}")
+    
     # Determine if we should use parallel processing
+    num_dated = len(source_paths)
     cpu_count = os.cpu_count() or 1
     max_workers = max(1, int(cpu_count * 0.7))
-    workers = min(max_workers, num_files)
+    workers = min(max_workers, num_dated)
     
-    if num_files > 10 and workers > 1:
+    if num_dated > 10 and workers > 1:
         # Parallel processing for large file sets
         print(f"Using parallel processing with {workers} workers...")
         
-        # Prepare arguments for each file
-        file_args = [(file_path, raw_txt_dir, filtered_data_dir) for file_path in filtered_files]
+        # Plain TXT files are only copied (I/O-bound), so they go to a thread pool;
+        # PDF/DOCX/HTML extraction is CPU-heavy enough to justify worker processes
+        txt_args = []
+        extract_args = []
+        for source_path_str, dest_path_str, txt in zip(source_paths, dest_paths, is_txt):
+            (txt_args if txt else extract_args).append((source_path_str, dest_path_str))
         
-        with ProcessPoolExecutor(max_workers=workers) as executor:
-            futures = {executor.submit(_process_single_file_for_filter, args): args[0] 
-                      for args in file_args}
+        # Hand tasks to the processes in chunks to amortize pickling/IPC per file
+        chunksize = max(1, len(extract_args) // (workers * 4))
+        
+        roots = (raw_root, filtered_root)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_filter_worker,
+                                 initargs=roots + (pdf_backend,)) as process_executor, \
+                ThreadPoolExecutor(max_workers=workers, initializer=_init_filter_worker,
+                                   initargs=roots) as thread_executor:
+            # Submit process work first so worker processes are forked before any threads start
+            extract_results = process_executor.map(_process_single_file_for_filter, extract_args,
+                                                   chunksize=chunksize)
+            txt_results = thread_executor.map(_process_single_file_for_filter, txt_args)
             
-            # Process all futures and track results
-            for future in tqdm(as_completed(futures), total=len(futures), 
-                              desc="Filtering and converting to TXT"):
-                file_path = futures[future]
-                try:
-                    success_path, error_msg = future.result()
+            # Process all results and track them
+            try:
+                for success_path, error_msg in tqdm(chain(extract_results, txt_results), total=num_dated,
+                                                    desc="Filtering and converting to TXT"):
                     if success_path:
                         successful_files.append(success_path)
                     else:
                         failed_files.append(error_msg)
-                        # Check if it's a date parsing failure (no "PDF conversion failed", "Error:", or "File not found" in message)
-                        if error_msg and "TXT conversion failed" not in error_msg and "Error:" not in error_msg and "File not found" not in error_msg:
-                            failed_date_parsing.append(error_msg)
-                except Exception as e:
-                    warnings.warn(f"Failed to process file {file_path}: {e}")
-                    failed_files.append(str(file_path))
+            except Exception as e:
+                # Per-file errors are caught in the worker, so this means the pool itself failed
+                warnings.warn(f"Parallel file processing stopped early: {e}")
         
         # Verify all files were processed
         total_processed = len(successful_files) + len(failed_files)
@@ -770,25 +1133,13 @@ def filter_and_copy_files(raw_txt_dir: Path, filtered_data_dir: Path,
             )
     else:
         # Sequential processing for small file sets
-        for file_path in tqdm(filtered_files, desc="Filtering and converting to TXT"):
+        for source_path_str, dest_path_str in tqdm(zip(source_paths, dest_paths), total=num_dated,
+                                                   desc="Filtering and converting to TXT"):
+            file_path = Path(_join_root(raw_root, source_path_str))
+            dest_path = Path(_join_root(filtered_root, dest_path_str))
             try:
-                # Validate date parsing (filename only, no content reading)
-                parsed_date = validate_date_parsing(file_path)
-                
-                if parsed_date is None:
-                    # File has no date in filename, add to failed list
-                    failed_files.append(str(file_path))
-                    failed_date_parsing.append(str(file_path))
-                    continue
-                
-                # Create destination filename with date prefix and sanitized name
-                dest_path = create_destination_filename(file_path, parsed_date, raw_txt_dir, filtered_data_dir)
-                
-                # Create parent directories
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
-                
                 # Convert file to TXT (or copy if already TXT)
-                if not convert_file_to_txt(file_path, dest_path):
+                if not convert_file_to_txt(file_path, dest_path, create_parent=False):
                     failed_files.append(f"{str(file_path)} (TXT conversion failed)")
                     continue
                 
@@ -806,106 +1157,72 @@ def filter_and_copy_files(raw_txt_dir: Path, filtered_data_dir: Path,
     print("Comparing raw_txt and filtered_data files...")
     print("=" * 80)
     
-    # Get all files from raw_txt (after applying exclude rules)
-    raw_txt_files_after_exclude = set()
-    for file_path in all_files:
-        try:
-            rel_path = file_path.relative_to(raw_txt_dir)
-            first_folder = rel_path.parts[0] if rel_path.parts else None
-            
-            # Skip if not in source folders
-            if first_folder not in all_folders:
-                continue
-            
-            # Check exclude rules (same logic as above)
-            should_exclude = False
-            for folder_name in exclude_folders:
-                if folder_name in rel_path.parts:
-                    should_exclude = True
-                    break
-                for part in rel_path.parts:
-                    if folder_name in part:
-                        should_exclude = True
-                        break
-                if should_exclude:
-                    break
-            
-            if not should_exclude:
-                rel_path_str = str(rel_path)
-                for pattern in exclude_path_patterns:
-                    if pattern in rel_path_str:
-                        should_exclude = True
-                        break
-            
-            if not should_exclude:
-                file_name = file_path.name
-                for file_prefix in exclude_files:
-                    if file_name.startswith(file_prefix):
-                        should_exclude = True
-                        break
-            
-            if not should_exclude:
-                raw_txt_files_after_exclude.add(str(rel_path))
-        except ValueError:
-            continue
-    
     # Get successfully processed files (relative paths as strings)
     # Also check filtered_data directory to find files that were successfully processed
     successful_relative_paths = set()
     
+    # Raw files found by the walk, keyed by full path string; lookups here
+    # replace an exists() stat plus relative_to() per file
+    raw_full_paths = {_join_root(raw_root, rel_path_str): rel_path_str
+                      for rel_path_str in raw_txt_files_after_exclude}
+    
     # First, add files from successful_files list
     for success_file in successful_files:
-        try:
-            success_path = Path(success_file)
-            if success_path.exists():
-                rel_path = success_path.relative_to(raw_txt_dir)
-                successful_relative_paths.add(str(rel_path))
-        except Exception:
-            pass
-    
-    # Second, scan filtered_data directory to find all processed files
-    # This catches files that were processed but might not be in successful_files list
-    if filtered_data_dir.exists():
-        for filtered_file in filtered_data_dir.rglob('*.txt'):
-            # Check if filename has date prefix format (YYYY-MM-DD_)
-            if re.match(r'^\d{4}-\d{2}-\d{2}_', filtered_file.name):
-                # Find original file
-                original_file = find_original_file_from_filtered(filtered_file, filtered_data_dir, raw_txt_dir)
-                if original_file and original_file.exists():
-                    try:
-                        rel_path = original_file.relative_to(raw_txt_dir)
-                        successful_relative_paths.add(str(rel_path))
-                    except Exception:
-                        pass
+        rel_path_str = raw_full_paths.get(success_file)
+        if rel_path_str is not None:
+            successful_relative_paths.add(rel_path_str)
     
     # Get failed date parsing files (relative paths as strings)
     failed_date_relative_paths = set()
     for failed_file in failed_date_parsing:
-        try:
-            failed_path = Path(failed_file)
-            if failed_path.exists():
-                rel_path = failed_path.relative_to(raw_txt_dir)
-                failed_date_relative_paths.add(str(rel_path))
-        except Exception:
-            # If it's already a relative path string, use it as is
-            failed_date_relative_paths.add(failed_file)
+        rel_path_str = raw_full_paths.get(failed_file)
+        if rel_path_str is not None:
+            failed_date_relative_paths.add(rel_path_str)
+    
+    # Second, scan filtered_data directory to find all processed files
+    # This catches files that were processed but might not be in successful_files list
+    # (e.g. converted by an earlier run), so it is only needed when this run's
+    # lists leave some raw files unaccounted for
+    unaccounted = raw_txt_files_after_exclude - successful_relative_paths - failed_date_relative_paths
+    if unaccounted and filtered_data_dir.exists():
+        # Paths stay strings here: iter_files yields paths under filtered_data_dir
+        # and the index yields paths under raw_txt_dir, so relative paths are
+        # prefix slices, and a Path is only built once per folder
+        raw_prefix = _join_root(raw_root, '')
+        raw_index = RawFileIndex(raw_txt_dir)
+        folder_paths: Dict[str, Path] = {}
+        for filtered_file_str in iter_files(filtered_data_dir, ('.txt',)):
+            # Check if filename has date prefix format (YYYY-MM-DD_); the full
+            # pattern is still checked by the matcher, this just skips the rest cheaply
+            filename = os.path.basename(filtered_file_str)
+            if not has_date_prefix(filename):
+                continue
+            folder_str = os.path.dirname(filtered_file_str[len(filtered_prefix):])
+            folder_path = folder_paths.get(folder_str)
+            if folder_path is None:
+                folder_path = folder_paths[folder_str] = Path(folder_str)
+            
+            # Find original file
+            original_file_str = _find_original_path_str(filename, folder_path, raw_index)
+            if original_file_str is None:
+                continue
+            rel_path_str = raw_full_paths.get(original_file_str)
+            if rel_path_str is None and original_file_str.startswith(raw_prefix):
+                # Matched a raw file outside the filtered set (e.g. an excluded one);
+                # it was just listed by the index, so no exists() check is needed
+                rel_path_str = original_file_str[len(raw_prefix):]
+            if rel_path_str is not None:
+                successful_relative_paths.add(rel_path_str)
     
     # Find missing files (in raw_txt but not in successful or failed_date_parsing)
-    truly_missing = []
-    for raw_rel_path_str in raw_txt_files_after_exclude:
-        if raw_rel_path_str not in successful_relative_paths and raw_rel_path_str not in failed_date_relative_paths:
-            truly_missing.append(raw_rel_path_str)
+    truly_missing = raw_txt_files_after_exclude - successful_relative_paths - failed_date_relative_paths
     
     # Add missing files to failed_date_parsing list and update the file
     if truly_missing:
         # Convert relative paths to full paths for failed_date_parsing
-        missing_full_paths = []
-        for missing_rel_path_str in truly_missing:
-            missing_full_path = raw_txt_dir / missing_rel_path_str
-            if missing_full_path.exists():
-                missing_full_paths.append(str(missing_full_path))
-            else:
-                missing_full_paths.append(str(missing_rel_path_str))
+        # (they all come from the walk of raw_txt_dir, so they exist)
+        missing_full_paths = [_join_root(raw_root, missing_rel_path_str)
+                              for missing_rel_path_str in truly_missing]
         
         # Add missing files to failed_date_parsing list
         failed_date_parsing.extend(missing_full_paths)
@@ -919,51 +1236,33 @@ def filter_and_copy_files(raw_txt_dir: Path, filtered_data_dir: Path,
         print(f"   Failed date parsing: {len(failed_date_relative_paths)}")
         print(f"   Total: {len(successful_relative_paths) + len(failed_date_relative_paths)}")
     
-    # Write all failed files (date parsing failures + missing files) to failed_date_parsing.txt
+    # Collect all failed files (date parsing failures + missing files)
+    all_failed_files = set()  # Use set to avoid duplicates
+    for file_path_str in failed_date_parsing:
+        # Skip excluded folders/files/paths in failed list (entries are
+        # already path strings, so the name is a plain basename)
+        if not is_excluded(file_path_str, file_path_str, os.path.basename(file_path_str)):
+            all_failed_files.add(file_path_str)
+    
+    # Write them to failed_date_parsing.txt, building the text up front so the
+    # list goes out in one write instead of one call per file
+    header_lines = [
+        "# Files that failed date parsing from filename or are missing from filtered_data\n",
+        "# Expected format: YYYY-MM-DD_filename.txt\n",
+        "# These files have no date information in their filename or were not processed\n",
+        "# Date parsing is done from filename only (no content reading)\n\n",
+        "# Excluded files (not included in this list):\n",
+    ]
+    header_lines.extend(f"# - Folders named or containing: {folder_name}\n" for folder_name in exclude_folders)
+    header_lines.extend(f"# - Files starting with: {file_prefix}\n" for file_prefix in exclude_files)
+    header_lines.extend(f"# - Paths containing: {pattern}\n" for pattern in exclude_path_patterns)
+    header_lines.append("\n")
+    
     with open(failed_list_path, 'w', encoding='utf-8') as f:
-        f.write("# Files that failed date parsing from filename or are missing from filtered_data\n")
-        f.write("# Expected format: YYYY-MM-DD_filename.txt\n")
-        f.write("# These files have no date information in their filename or were not processed\n")
-        f.write("# Date parsing is done from filename only (no content reading)\n\n")
-        f.write("# Excluded files (not included in this list):\n")
-        for folder_name in exclude_folders:
-            f.write(f"# - Folders named or containing: {folder_name}\n")
-        for file_prefix in exclude_files:
-            f.write(f"# - Files starting with: {file_prefix}\n")
-        for pattern in exclude_path_patterns:
-            f.write(f"# - Paths containing: {pattern}\n")
-        f.write("\n")
-        
-        # Write all failed files (date parsing failures + missing files)
-        all_failed_files = set()  # Use set to avoid duplicates
-        for file_path in failed_date_parsing:
-            # Skip excluded folders/files/paths in failed list
-            should_skip = False
-            file_path_str = str(file_path)
-            # Check excluded folders
-            for folder_name in exclude_folders:
-                if folder_name in file_path_str:
-                    should_skip = True
-                    break
-            # Check excluded path patterns
-            if not should_skip:
-                for pattern in exclude_path_patterns:
-                    if pattern in file_path_str:
-                        should_skip = True
-                        break
-            # Check excluded files
-            if not should_skip:
-                file_name = Path(file_path_str).name
-                for file_prefix in exclude_files:
-                    if file_name.startswith(file_prefix):
-                        should_skip = True
-                        break
-            if not should_skip:
-                all_failed_files.add(file_path_str)
-        
+        f.write(''.join(header_lines))
         # Write all failed files (sorted)
-        for file_path in sorted(all_failed_files):
-            f.write(f"{file_path}\n")
+        if all_failed_files:
+            f.write('\n'.join(sorted(all_failed_files)) + '\n')
     
     print(f"\nSummary:")
     print(f"  Successful: {len(successful_files)} files")
@@ -6,18 +6,53 @@ import subprocess
 import shutil
 import tempfile
 import os
+import atexit
+import multiprocessing
+from collections import Counter, defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, Optional, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 from tqdm import tqdm
 
 try:
     import pdfplumber
-    PDF_SUPPORT = True
+    PDFPLUMBER_SUPPORT = True
 except ImportError:
-    PDF_SUPPORT = False
+    PDFPLUMBER_SUPPORT = False
+
+try:
+    import pymupdf
+    PYMUPDF_SUPPORT = True
+except ImportError:
+    PYMUPDF_SUPPORT = False
+
+try:
+    import pypdfium2
+    PYPDFIUM2_SUPPORT = True
+except ImportError:
+    PYPDFIUM2_SUPPORT = False
+
+# Installed PDF text backends, fastest first (PyMuPDF and pypdfium2 extract in C)
+PDF_BACKENDS = tuple(
+    name for name, supported in (
+        ('pymupdf', PYMUPDF_SUPPORT),
+        ('pypdfium2', PYPDFIUM2_SUPPORT),
+        ('pdfplumber', PDFPLUMBER_SUPPORT),
+    ) if supported
+)
+
+# Backend used by extract_text_from_pdf. The backends' text differs slightly,
+# so it is pdfplumber (the reference output) unless chosen explicitly with
+# set_pdf_backend (PDF_BACKEND setting in the config)
+PDF_BACKEND = 'pdfplumber' if PDFPLUMBER_SUPPORT else (PDF_BACKENDS[0] if PDF_BACKENDS else None)
+
+PDF_SUPPORT = PDF_BACKEND is not None
+if not PDF_SUPPORT:
     warnings.warn("pdfplumber not available, PDF support disabled")
+elif not PDFPLUMBER_SUPPORT:
+    warnings.warn(f"pdfplumber not available, extracting PDF text with {PDF_BACKEND}")
 
 try:
     from docx import Document
@@ -26,10 +61,98 @@ except ImportError:
     DOCX_SUPPORT = False
     warnings.warn("python-docx not available, DOCX support disabled")
 
+try:
+    import lxml.html
+    LXML_SUPPORT = True
+except ImportError:
+    LXML_SUPPORT = False
+
+# HTML cleanup patterns, compiled once at import
+_SCRIPT_RE = re.compile(r'<script[^>]*>.*?</script>', re.DOTALL | re.IGNORECASE)
+_STYLE_RE = re.compile(r'<style[^>]*>.*?</style>', re.DOTALL | re.IGNORECASE)
+_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Header patterns, compiled once at import
+_TITLE_RE = re.compile(r'Title:\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE)
+_SOURCE_RE = re.compile(r'Source:\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE)
+_HEADER_SEARCH_RE = re.compile(r'^(?:Title|Date|Source):', re.IGNORECASE | re.MULTILINE)
+# A header line or a blank line, with its line break
+_HEADER_OR_BLANK_LINE_RE = re.compile(
+    r'^(?:(?:Title|Date|Source):[^\n]*|[^\S\n]*)(?:\n|\Z)', re.IGNORECASE | re.MULTILINE
+)
+
+# Month name (lowercased) -> zero-padded month number, shared by the date parsers
+_MONTH_NAMES: Dict[str, str] = {
+    'january': '01', 'jan': '01', 'jan.': '01',
+    'february': '02', 'feb': '02', 'feb.': '02',
+    'march': '03', 'mar': '03', 'mar.': '03',
+    'april': '04', 'apr': '04', 'apr.': '04',
+    'may': '05', 'may.': '05',
+    'june': '06', 'jun': '06', 'jun.': '06',
+    'july': '07', 'jul': '07', 'jul.': '07',
+    'august': '08', 'aug': '08', 'aug.': '08',
+    'september': '09', 'sep': '09', 'sep.': '09', 'sept': '09', 'sept.': '09',
+    'october': '10', 'oct': '10', 'oct.': '10',
+    'november': '11', 'nov': '11', 'nov.': '11',
+    'december': '12', 'dec': '12', 'dec.': '12'
+}
+
+# Date patterns tried in order by parse_date_from_text
+_DATE_TEXT_RE = re.compile(r'Date:\s*(\d{4}-\d{2}-\d{2})', re.IGNORECASE)
+_MD_YY_TEXT_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{2,4})')
+_DAY_MONTH_YEAR_TEXT_RE = re.compile(r'(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})', re.IGNORECASE)
+_MONTH_DAY_YEAR_TEXT_RE = re.compile(r'([A-Za-z]+\.?)\s+(\d{1,2}),?\s+(\d{4})', re.IGNORECASE)
+_UPDATED_PUBLISHED_TEXT_RE = re.compile(
+    r'(?:Updated|Published):\s*([A-Za-z]+\.?)\s+(\d{1,2}),?\s+(\d{4})', re.IGNORECASE
+)
+_BROADCAST_YEAR_TEXT_RE = re.compile(
+    r'Broadcast:\s*[A-Za-z]+,\s*([A-Za-z]+\.?)\s+(\d{1,2}),?\s+(\d{4})', re.IGNORECASE
+)
+_BROADCAST_NO_YEAR_TEXT_RE = re.compile(
+    r'Broadcast:\s*[A-Za-z]+,\s*([A-Za-z]+\.?)\s+(\d{1,2})(?!\s*\d{4})', re.IGNORECASE
+)
+_YMD_TEXT_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
+# Date patterns tried in order by parse_date_from_filename
+_DATE_PATH_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})_')
+_YMD_NAME_RE = re.compile(r'(\d{4})[-_.](\d{2})[-_.](\d{2})')
+_MM_DD_YYYY_NAME_RE = re.compile(r'(\d{1,2})[-_](\d{1,2})[-_](\d{4})')
+_MM_DD_YY_NAME_RE = re.compile(r'(\d{1,2})[-_](\d{1,2})[-_](\d{2})(?!\d)')
+_MONTH_DAY_YEAR_NAME_RE = re.compile(r'([A-Za-z]+\.?)\s+(\d{1,2})[,_\s]+(\d{4})', re.IGNORECASE)
+_MONTH_YEAR_NAME_RE = re.compile(r'([A-Za-z]+)[-_](\d{4})', re.IGNORECASE)
+_MM_YYYY_NAME_RE = re.compile(r'(\d{1,2})[-_](\d{4})(?![-_]\d)')
+_YEAR_MONTH_NAME_RE = re.compile(r'(\d{4})[-_.](\d{2})(?![-_.]\d{2})')
+
+
+def _html_to_text_lxml(content: str) -> str:
+    """Extract text from HTML by parsing it once with lxml.
+    
+    Text nodes are joined with spaces (tags separate words, as in the regex
+    path); script/style contents and comments are left out, and all
+    entities are decoded by the parser.
+    
+    Args:
+        content: HTML source
+        
+    Returns:
+        Extracted text with whitespace collapsed
+    """
+    if not content.strip():
+        return ''
+    doc = lxml.html.fromstring(content)
+    for element in doc.xpath('//script|//style'):
+        element.drop_tree()
+    return _WHITESPACE_RE.sub(' ', ' '.join(doc.itertext())).strip()
+
 
 def extract_text_from_html(html_path: Path) -> Optional[str]:
     """Extract text from HTML file, removing JavaScript and CSS.
     
+    Uses lxml when available and falls back to regex cleanup otherwise (or
+    if lxml cannot parse the document).
+    
     Args:
         html_path: Path to HTML file
         
@@ -40,17 +163,23 @@ def extract_text_from_html(html_path: Path) -> Optional[str]:
         with open(html_path, 'r', encoding='utf-8', errors='ignore') as f:
             content = f.read()
         
+        if LXML_SUPPORT:
+            try:
+                return _html_to_text_lxml(content)
+            except Exception:
+                pass
+        
         # Remove script tags and their content
-        content = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.DOTALL | re.IGNORECASE)
+        content = _SCRIPT_RE.sub('', content)
         
         # Remove style tags and their content
-        content = re.sub(r'<style[^>]*>.*?</style>', '', content, flags=re.DOTALL | re.IGNORECASE)
+        content = _STYLE_RE.sub('', content)
         
         # Remove HTML comments
-        content = re.sub(r'<!--.*?-->', '', content, flags=re.DOTALL)
+        content = _COMMENT_RE.sub('', content)
         
         # Remove HTML tags but keep text content
-        content = re.sub(r'<[^>]+>', ' ', content)
+        content = _TAG_RE.sub(' ', content)
         
         # Decode HTML entities (basic ones)
         content = content.replace('&nbsp;', ' ')
@@ -61,7 +190,7 @@ def extract_text_from_html(html_path: Path) -> Optional[str]:
         content = content.replace('&#39;', "'")
         
         # Remove extra whitespace
-        content = re.sub(r'\s+', ' ', content)
+        content = _WHITESPACE_RE.sub(' ', content)
         
         return content.strip()
     except Exception as e:
@@ -69,6 +198,30 @@ def extract_text_from_html(html_path: Path) -> Optional[str]:
         return None
 
 
+@lru_cache(maxsize=1024)
+def _compile_preferred_date_patterns(preferred_date: str) -> Tuple[Tuple[re.Pattern, ...], re.Pattern]:
+    """Compile the patterns parse_date_from_text uses to look for a preferred date.
+    
+    Args:
+        preferred_date: Date in YYYY-MM-DD format
+        
+    Returns:
+        Tuple of (month-name patterns such as "Oct. 9, 2018", M/D/YYYY pattern)
+    """
+    preferred_year, preferred_month, preferred_day = preferred_date.split('-')
+    
+    # Reverse lookup: find month names for preferred_month, in various formats
+    month_day_patterns = []
+    for month_name in (name for name, num in _MONTH_NAMES.items() if num == preferred_month):
+        month_day_patterns.append(re.compile(
+            rf'{month_name}\s+{int(preferred_day)},?\s+{preferred_year}', re.IGNORECASE))
+        month_day_patterns.append(re.compile(
+            rf'{month_name}\.\s+{int(preferred_day)},?\s+{preferred_year}', re.IGNORECASE))
+    
+    md_pattern = re.compile(rf'{int(preferred_month)}/{int(preferred_day)}/{preferred_year}')
+    return tuple(month_day_patterns), md_pattern
+
+
 def parse_date_from_text(text: str, file_path: Optional[Path] = None, preferred_date: Optional[str] = None) -> Optional[str]:
     """Extract date from text content (various formats).
     
@@ -85,85 +238,30 @@ def parse_date_from_text(text: str, file_path: Optional[Path] = None, preferred_
     
     # If preferred_date is provided, try to find matching date first
     if preferred_date:
-        # Try to find the preferred date in various formats
-        preferred_year, preferred_month, preferred_day = preferred_date.split('-')
-        
-        # Check all date patterns and return if matches preferred_date
-        patterns_to_check = [
-            # YYYY-MM-DD
-            (rf'{preferred_year}-{preferred_month}-{preferred_day}', lambda m: f"{m.group(1)}-{m.group(2)}-{m.group(3)}"),
-            # Month DD, YYYY (need to convert month number to name)
-            (rf'([A-Za-z]+\.?)\s+{preferred_day},?\s+{preferred_year}', None),  # Will check month separately
-            # M/D/YYYY or M/D/YY
-            (rf'{int(preferred_month)}/{int(preferred_day)}/{preferred_year}', None),
-            (rf'{int(preferred_month)}/{int(preferred_day)}/{preferred_year[2:]}', None),
-        ]
+        month_day_patterns, md_pattern = _compile_preferred_date_patterns(preferred_date)
         
         # Check for Month DD, YYYY format matching preferred date
-        month_names = {
-            'january': '01', 'jan': '01', 'jan.': '01',
-            'february': '02', 'feb': '02', 'feb.': '02',
-            'march': '03', 'mar': '03', 'mar.': '03',
-            'april': '04', 'apr': '04', 'apr.': '04',
-            'may': '05', 'may.': '05',
-            'june': '06', 'jun': '06', 'jun.': '06',
-            'july': '07', 'jul': '07', 'jul.': '07',
-            'august': '08', 'aug': '08', 'aug.': '08',
-            'september': '09', 'sep': '09', 'sep.': '09', 'sept': '09', 'sept.': '09',
-            'october': '10', 'oct': '10', 'oct.': '10',
-            'november': '11', 'nov': '11', 'nov.': '11',
-            'december': '12', 'dec': '12', 'dec.': '12'
-        }
-        
-        # Reverse lookup: find month name for preferred_month
-        month_name_candidates = [name for name, num in month_names.items() if num == preferred_month]
-        
-        if month_name_candidates:
-            for month_name in month_name_candidates:
-                # Try various formats
-                patterns = [
-                    rf'{month_name}\s+{int(preferred_day)},?\s+{preferred_year}',
-                    rf'{month_name}\.\s+{int(preferred_day)},?\s+{preferred_year}',
-                ]
-                for pattern in patterns:
-                    match = re.search(pattern, text, re.IGNORECASE)
-                    if match:
-                        return preferred_date
+        for pattern in month_day_patterns:
+            if pattern.search(text):
+                return preferred_date
         
         # Try YYYY-MM-DD format
         if preferred_date in text:
             return preferred_date
         
         # Try M/D/YYYY format
-        md_pattern = rf'{int(preferred_month)}/{int(preferred_day)}/{preferred_year}'
-        if re.search(md_pattern, text):
+        if md_pattern.search(text):
             return preferred_date
     
-    # Month names mapping
-    month_names = {
-        'january': '01', 'jan': '01', 'jan.': '01',
-        'february': '02', 'feb': '02', 'feb.': '02',
-        'march': '03', 'mar': '03', 'mar.': '03',
-        'april': '04', 'apr': '04', 'apr.': '04',
-        'may': '05', 'may.': '05',
-        'june': '06', 'jun': '06', 'jun.': '06',
-        'july': '07', 'jul': '07', 'jul.': '07',
-        'august': '08', 'aug': '08', 'aug.': '08',
-        'september': '09', 'sep': '09', 'sep.': '09', 'sept': '09', 'sept.': '09',
-        'october': '10', 'oct': '10', 'oct.': '10',
-        'november': '11', 'nov': '11', 'nov.': '11',
-        'december': '12', 'dec': '12', 'dec.': '12'
-    }
-    
     # 1. Try "Date: YYYY-MM-DD" format
-    match = re.search(r'Date:\s*(\d{4}-\d{2}-\d{2})', text, re.IGNORECASE)
+    match = _DATE_TEXT_RE.search(text)
     if match:
         return match.group(1)
     
     # 2. Try "M/D/YY" or "M/D/YYYY" format (e.g., "1/14/20", "1/14/2020", "01/14/20")
     # This is a common US date format and should be checked early
     # This format is often the actual document date
-    md_yy_match = re.search(r'(\d{1,2})/(\d{1,2})/(\d{2,4})', text)
+    md_yy_match = _MD_YY_TEXT_RE.search(text)
     if md_yy_match:
         month, day, year = md_yy_match.groups()
         month_int = int(month)
@@ -185,84 +283,59 @@ def parse_date_from_text(text: str, file_path: Optional[Path] = None, preferred_
     
     # 3. Try "DD Month YYYY" format (e.g., "19 December 2018")
     # Look for pattern: 1-2 digits, month name, 4-digit year
-    month_day_year = re.search(
-        r'(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})',
-        text,
-        re.IGNORECASE
-    )
+    month_day_year = _DAY_MONTH_YEAR_TEXT_RE.search(text)
     if month_day_year:
         day, month_str, year = month_day_year.groups()
-        month_lower = month_str.lower()
-        if month_lower in month_names:
-            month = month_names[month_lower]
+        month = _MONTH_NAMES.get(month_str.lower())
+        if month:
             day_padded = day.zfill(2)
             return f"{year}-{month}-{day_padded}"
     
     # 4. Try "Month DD, YYYY" or "Month DD YYYY" format (e.g., "December 19, 2018" or "Oct. 09, 2018")
     # Support both "Month." and "Month" formats
-    month_day_year2 = re.search(
-        r'([A-Za-z]+\.?)\s+(\d{1,2}),?\s+(\d{4})',
-        text,
-        re.IGNORECASE
-    )
+    month_day_year2 = _MONTH_DAY_YEAR_TEXT_RE.search(text)
     if month_day_year2:
         month_str, day, year = month_day_year2.groups()
-        month_lower = month_str.lower().rstrip('.')  # Remove trailing dot if present
-        if month_lower in month_names:
-            month = month_names[month_lower]
+        month = _MONTH_NAMES.get(month_str.lower().rstrip('.'))  # Remove trailing dot if present
+        if month:
             day_padded = day.zfill(2)
             return f"{year}-{month}-{day_padded}"
     
     # 4. Try "Updated: Month DD, YYYY" or "Published: Month DD, YYYY" format
     # (e.g., "Updated: Oct. 09, 2018" or "Published: Oct. 09, 2018")
-    updated_published = re.search(
-        r'(?:Updated|Published):\s*([A-Za-z]+\.?)\s+(\d{1,2}),?\s+(\d{4})',
-        text,
-        re.IGNORECASE
-    )
+    updated_published = _UPDATED_PUBLISHED_TEXT_RE.search(text)
     if updated_published:
         month_str, day, year = updated_published.groups()
-        month_lower = month_str.lower().rstrip('.')  # Remove trailing dot if present
-        if month_lower in month_names:
-            month = month_names[month_lower]
+        month = _MONTH_NAMES.get(month_str.lower().rstrip('.'))  # Remove trailing dot if present
+        if month:
             day_padded = day.zfill(2)
             return f"{year}-{month}-{day_padded}"
     
     # 5. Try "Broadcast: Weekday, Month DD, YYYY" or "Broadcast: Weekday, Month DD" format
     # (e.g., "Broadcast: Tuesday, Aug. 17, 2021" or "Broadcast: Tuesday, Aug. 17")
-    broadcast_with_year = re.search(
-        r'Broadcast:\s*[A-Za-z]+,\s*([A-Za-z]+\.?)\s+(\d{1,2}),?\s+(\d{4})',
-        text,
-        re.IGNORECASE
-    )
+    broadcast_with_year = _BROADCAST_YEAR_TEXT_RE.search(text)
     if broadcast_with_year:
         month_str, day, year = broadcast_with_year.groups()
-        month_lower = month_str.lower().rstrip('.')  # Remove trailing dot if present
-        if month_lower in month_names:
-            month = month_names[month_lower]
+        month = _MONTH_NAMES.get(month_str.lower().rstrip('.'))  # Remove trailing dot if present
+        if month:
             day_padded = day.zfill(2)
             return f"{year}-{month}-{day_padded}"
     
     # 6. Try "Broadcast: Weekday, Month DD" format (year from filename will be used)
     # (e.g., "Broadcast: Tuesday, Aug. 17")
     # Note: This returns a special format that will be combined with year from filename
-    broadcast_no_year = re.search(
-        r'Broadcast:\s*[A-Za-z]+,\s*([A-Za-z]+\.?)\s+(\d{1,2})(?!\s*\d{4})',
-        text,
-        re.IGNORECASE
-    )
+    broadcast_no_year = _BROADCAST_NO_YEAR_TEXT_RE.search(text)
     if broadcast_no_year:
         month_str, day = broadcast_no_year.groups()
-        month_lower = month_str.lower().rstrip('.')  # Remove trailing dot if present
-        if month_lower in month_names:
-            month = month_names[month_lower]
+        month = _MONTH_NAMES.get(month_str.lower().rstrip('.'))  # Remove trailing dot if present
+        if month:
             day_padded = day.zfill(2)
             # Return special format "PARTIAL-MM-DD" to be combined with year from filename
             # This will be handled in validate_date_parsing
             return f"PARTIAL-{month}-{day_padded}"
     
     # 7. Try "YYYY-MM-DD" format anywhere in text
-    ymd_match = re.search(r'(\d{4})-(\d{2})-(\d{2})', text)
+    ymd_match = _YMD_TEXT_RE.search(text)
     if ymd_match:
         year, month, day = ymd_match.groups()
         # Validate
@@ -285,9 +358,25 @@ def parse_date_from_path(file_path: Path) -> Optional[str]:
     Returns:
         Date string in YYYY-MM-DD format or None if no date found in filename
     """
+    return parse_date_from_filename(file_path.name)
+
+
+@lru_cache(maxsize=65536)
+def parse_date_from_filename(filename: str) -> Optional[str]:
+    """Extract date from a filename (cached, see parse_date_from_path).
+    
+    Lets callers that already have the name as a string (e.g. from
+    os.scandir) skip building a Path.
+    
+    Args:
+        filename: File name including extension
+        
+    Returns:
+        Date string in YYYY-MM-DD format or None if no date found
+    """
     # 0. Check filename prefix for YYYY-MM-DD_ format (highest priority)
     # This is the standard format used in filtered_data
-    prefix_match = re.match(r'^(\d{4})-(\d{2})-(\d{2})_', file_path.name)
+    prefix_match = _DATE_PATH_RE.match(filename)
     if prefix_match:
         year, month, day = prefix_match.groups()
         # Validate date
@@ -295,14 +384,14 @@ def parse_date_from_path(file_path: Path) -> Optional[str]:
             return f"{year}-{month}-{day}"
     
     # 1. Check filename for YYYY-MM-DD, YYYY_MM_DD, or YYYY.MM.DD
-    filename_match = re.search(r'(\d{4})[-_.](\d{2})[-_.](\d{2})', file_path.name)
+    filename_match = _YMD_NAME_RE.search(filename)
     if filename_match:
         year, month, day = filename_match.groups()
         return f"{year}-{month}-{day}"
     
     # 1.5. Check filename for MM_DD_YYYY or MM-DD-YYYY format (e.g., "02_24_2022", "12_06_2022")
     # This pattern appears in some news article filenames
-    mm_dd_yyyy_match = re.search(r'(\d{1,2})[-_](\d{1,2})[-_](\d{4})', file_path.name)
+    mm_dd_yyyy_match = _MM_DD_YYYY_NAME_RE.search(filename)
     if mm_dd_yyyy_match:
         num1, num2, year = mm_dd_yyyy_match.groups()
         num1_int = int(num1)
@@ -320,7 +409,7 @@ def parse_date_from_path(file_path: Path) -> Optional[str]:
     
     # 1.6. Check filename for MM_DD_YY or MM-DD-YY format (2-digit year, e.g., "04_17_23", "12_06_22")
     # This pattern appears in some news article filenames with 2-digit year
-    mm_dd_yy_match = re.search(r'(\d{1,2})[-_](\d{1,2})[-_](\d{2})(?!\d)', file_path.name)
+    mm_dd_yy_match = _MM_DD_YY_NAME_RE.search(filename)
     if mm_dd_yy_match:
         num1, num2, year_2digit = mm_dd_yy_match.groups()
         num1_int = int(num1)
@@ -344,52 +433,27 @@ def parse_date_from_path(file_path: Path) -> Optional[str]:
             return f"{year}-{month}-{day}"
     
     # 2. Check filename for MMM. DD, YYYY format (e.g., "Nov. 07, 2018")
-    month_names = {
-        'jan': '01', 'january': '01', 'jan.': '01',
-        'feb': '02', 'february': '02', 'feb.': '02',
-        'mar': '03', 'march': '03', 'mar.': '03',
-        'apr': '04', 'april': '04', 'apr.': '04',
-        'may': '05', 'may.': '05',
-        'jun': '06', 'june': '06', 'jun.': '06',
-        'jul': '07', 'july': '07', 'jul.': '07',
-        'aug': '08', 'august': '08', 'aug.': '08',
-        'sep': '09', 'september': '09', 'sep.': '09', 'sept.': '09',
-        'oct': '10', 'october': '10', 'oct.': '10',
-        'nov': '11', 'november': '11', 'nov.': '11',
-        'dec': '12', 'december': '12', 'dec.': '12'
-    }
-    
     # Pattern: MMM. DD, YYYY or MMM DD, YYYY or MMM DD_YYYY (e.g., "Nov. 07, 2018", "July 17_2020")
-    month_day_year = re.search(
-        r'([A-Za-z]+\.?)\s+(\d{1,2})[,_\s]+(\d{4})', 
-        file_path.name, 
-        re.IGNORECASE
-    )
+    month_day_year = _MONTH_DAY_YEAR_NAME_RE.search(filename)
     if month_day_year:
         month_str, day, year = month_day_year.groups()
-        month_lower = month_str.lower().rstrip('.')  # Remove trailing dot if present
-        if month_lower in month_names:
-            month = month_names[month_lower]
+        month = _MONTH_NAMES.get(month_str.lower().rstrip('.'))  # Remove trailing dot if present
+        if month:
             day_padded = day.zfill(2)
             return f"{year}-{month}-{day_padded}"
     
     # 3. Check for MMM_YYYY or MMM-YYYY format in filename (e.g., "Feb_2022", "Feb-2022")
-    month_year_pattern = re.search(
-        r'([A-Za-z]+)[-_](\d{4})',
-        file_path.name,
-        re.IGNORECASE
-    )
+    month_year_pattern = _MONTH_YEAR_NAME_RE.search(filename)
     if month_year_pattern:
         month_str, year = month_year_pattern.groups()
-        month_lower = month_str.lower().rstrip('.')  # Remove trailing dot if present
-        if month_lower in month_names:
-            month = month_names[month_lower]
+        month = _MONTH_NAMES.get(month_str.lower().rstrip('.'))  # Remove trailing dot if present
+        if month:
             # Use first day of month
             return f"{year}-{month}-01"
     
     # 3.5. Check for MM_YYYY or MM-YYYY format in filename (numeric month only, e.g., "09_2024", "06_2025")
     # This pattern appears in some filenames with numeric month
-    mm_yyyy_match = re.search(r'(\d{1,2})[-_](\d{4})(?![-_]\d)', file_path.name)
+    mm_yyyy_match = _MM_YYYY_NAME_RE.search(filename)
     if mm_yyyy_match:
         month_str, year = mm_yyyy_match.groups()
         month_int = int(month_str)
@@ -400,7 +464,7 @@ def parse_date_from_path(file_path: Path) -> Optional[str]:
             return f"{year}-{month}-01"
     
     # 4. Check for YYYY-MM, YYYY_MM, or YYYY.MM in filename
-    year_month = re.search(r'(\d{4})[-_.](\d{2})(?![-_.]\d{2})', file_path.name)
+    year_month = _YEAR_MONTH_NAME_RE.search(filename)
     if year_month:
         year, month = year_month.groups()
         return f"{year}-{month}-01"
@@ -418,7 +482,7 @@ def parse_title_from_text(text: str) -> Optional[str]:
     Returns:
         Title string or None
     """
-    match = re.search(r'Title:\s*(.+?)(?:\n|$)', text, re.IGNORECASE | re.MULTILINE)
+    match = _TITLE_RE.search(text)
     if match:
         return match.group(1).strip()
     return None
@@ -433,15 +497,195 @@ def parse_source_from_text(text: str) -> Optional[str]:
     Returns:
         Source string or None
     """
-    match = re.search(r'Source:\s*(.+?)(?:\n|$)', text, re.IGNORECASE | re.MULTILINE)
+    match = _SOURCE_RE.search(text)
     if match:
         return match.group(1).strip()
     return None
 
 
+# In the main process, PDFs with more pages than this are split into page
+# ranges extracted by worker processes. Inside any worker process (file- or
+# group-level pools) pages are extracted serially to avoid nested pools
+_PDF_PARALLEL_MIN_PAGES = 32
+_PDF_MAX_PAGE_WORKERS = 4
+
+# Page-range pool shared by all large PDFs of the process, created on first
+# use so its start-up cost is paid once rather than once per document
+_pdf_page_executor: Optional[ProcessPoolExecutor] = None
+
+
+def set_pdf_backend(backend: str) -> Optional[str]:
+    """Select the PDF text backend used by extract_text_from_pdf in this process.
+    
+    Args:
+        backend: 'pdfplumber', 'pypdfium2', 'pymupdf', or 'auto' for the
+            fastest installed backend
+        
+    Returns:
+        Name of the selected backend (None if no backend is installed)
+        
+    Raises:
+        ValueError: If the backend is unknown or not installed
+    """
+    global PDF_BACKEND
+    if backend == 'auto':
+        backend = PDF_BACKENDS[0] if PDF_BACKENDS else None
+    elif backend not in PDF_BACKENDS:
+        raise ValueError(
+            f"PDF backend '{backend}' is not available "
+            f"(installed: {', '.join(PDF_BACKENDS) or 'none'})"
+        )
+    PDF_BACKEND = backend
+    return backend
+
+
+def _init_pdf_worker(backend: Optional[str]) -> None:
+    """Executor initializer giving worker processes the parent's PDF backend.
+    
+    Needed where workers are spawned rather than forked (e.g. Windows).
+    
+    Args:
+        backend: Backend name as selected in the parent process
+    """
+    global PDF_BACKEND
+    PDF_BACKEND = backend
+
+
+def _extract_pdf_pages_pymupdf(pdf_path: str, start: int, stop: Optional[int],
+                               max_pages: Optional[int]) -> Tuple[int, Optional[List[str]]]:
+    """Extract text of a page range with PyMuPDF (see _extract_pdf_pages)."""
+    with pymupdf.open(pdf_path) as doc:
+        page_count = doc.page_count
+        if max_pages is not None and page_count > max_pages:
+            return page_count, None
+        stop = page_count if stop is None else min(stop, page_count)
+        return page_count, [doc[index].get_text() for index in range(start, stop)]
+
+
+def _extract_pdf_pages_pypdfium2(pdf_path: str, start: int, stop: Optional[int],
+                                 max_pages: Optional[int]) -> Tuple[int, Optional[List[str]]]:
+    """Extract text of a page range with pypdfium2 (see _extract_pdf_pages)."""
+    pdf = pypdfium2.PdfDocument(pdf_path)
+    try:
+        page_count = len(pdf)
+        if max_pages is not None and page_count > max_pages:
+            return page_count, None
+        stop = page_count if stop is None else min(stop, page_count)
+        page_texts = []
+        for index in range(start, stop):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            page_text = textpage.get_text_range()
+            textpage.close()
+            page.close()
+            # PDFium ends lines with CRLF and marks hyphenation breaks with U+FFFE
+            page_texts.append(page_text.replace('\r\n', '\n').replace('\ufffe', ''))
+        return page_count, page_texts
+    finally:
+        pdf.close()
+
+
+def _extract_pdf_pages_pdfplumber(pdf_path: str, start: int, stop: Optional[int],
+                                  max_pages: Optional[int]) -> Tuple[int, Optional[List[str]]]:
+    """Extract text of a page range with pdfplumber (see _extract_pdf_pages)."""
+    # Suppress pdfplumber warnings about invalid PDF metadata (fonts, colors, etc.)
+    # These warnings don't affect text extraction
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', category=UserWarning, module='pdfplumber')
+        with pdfplumber.open(pdf_path) as pdf:
+            pages = pdf.pages
+            if max_pages is not None and len(pages) > max_pages:
+                return len(pages), None
+            page_texts = []
+            for page in pages[start:stop]:
+                page_texts.append(page.extract_text() or '')
+                # Drop the page's parsed objects now rather than holding
+                # every page until the document is closed
+                page.flush_cache()
+            return len(pages), page_texts
+
+
+def _extract_pdf_pages(pdf_path: str, start: int = 0, stop: Optional[int] = None,
+                       max_pages: Optional[int] = None,
+                       backend: Optional[str] = None) -> Tuple[int, Optional[List[str]]]:
+    """Extract the text of pages [start, stop) of a PDF.
+    
+    Module-level so it can run in worker processes.
+    
+    Args:
+        pdf_path: Path to PDF file
+        start: Index of the first page
+        stop: Index after the last page (None for the end of the document)
+        max_pages: If given and the document has more pages, extract nothing
+        backend: PDF text backend (None for PDF_BACKEND of this process)
+        
+    Returns:
+        Tuple of (number of pages in the document, list of page texts
+        (possibly empty strings) or None if it has more than max_pages pages)
+    """
+    backend = backend or PDF_BACKEND
+    if backend == 'pymupdf':
+        return _extract_pdf_pages_pymupdf(pdf_path, start, stop, max_pages)
+    if backend == 'pypdfium2':
+        return _extract_pdf_pages_pypdfium2(pdf_path, start, stop, max_pages)
+    return _extract_pdf_pages_pdfplumber(pdf_path, start, stop, max_pages)
+
+
+def _pdf_page_workers() -> int:
+    """Return the number of processes to split a large PDF across (1 in workers)."""
+    if multiprocessing.parent_process() is not None:
+        return 1
+    return min(_PDF_MAX_PAGE_WORKERS, max(1, int((os.cpu_count() or 1) * 0.7)))
+
+
+def _get_pdf_page_executor(workers: int) -> ProcessPoolExecutor:
+    """Return the shared page-range pool, starting it on first use."""
+    global _pdf_page_executor
+    if _pdf_page_executor is None:
+        _pdf_page_executor = ProcessPoolExecutor(max_workers=workers)
+        atexit.register(_shutdown_pdf_page_executor)
+    return _pdf_page_executor
+
+
+def _shutdown_pdf_page_executor() -> None:
+    """Stop the shared page-range pool if it was started."""
+    global _pdf_page_executor
+    if _pdf_page_executor is not None:
+        _pdf_page_executor.shutdown()
+        _pdf_page_executor = None
+
+
+def _extract_pdf_pages_parallel(pdf_path: str, page_count: int, workers: int) -> List[str]:
+    """Extract all pages of a large PDF in contiguous page ranges across processes.
+    
+    Args:
+        pdf_path: Path to PDF file
+        page_count: Number of pages in the document
+        workers: Number of worker processes
+        
+    Returns:
+        List of page texts in page order
+    """
+    step = -(-page_count // workers)
+    starts = range(0, page_count, step)
+    stops = [start + step for start in starts]
+    # The backend is passed with each range since the shared pool outlives
+    # any later set_pdf_backend call; map yields ranges in submission order,
+    # so pages stay in order
+    ranges = _get_pdf_page_executor(workers).map(
+        _extract_pdf_pages, [pdf_path] * len(starts), starts, stops,
+        [None] * len(starts), [PDF_BACKEND] * len(starts)
+    )
+    return [page_text for _, page_texts in ranges for page_text in page_texts]
+
+
 def extract_text_from_pdf(pdf_path: Path) -> Optional[str]:
     """Extract text from PDF file.
     
+    Uses the fastest installed backend (see PDF_BACKEND). When called from
+    the main process, PDFs with many pages are extracted by several
+    processes in parallel; worker processes extract them serially.
+    
     Args:
         pdf_path: Path to PDF file
         
@@ -452,17 +696,17 @@ def extract_text_from_pdf(pdf_path: Path) -> Optional[str]:
         return None
     
     try:
-        text_parts = []
-        # Suppress pdfplumber warnings about invalid PDF metadata (fonts, colors, etc.)
-        # These warnings don't affect text extraction
-        with warnings.catch_warnings():
-            warnings.filterwarnings('ignore', category=UserWarning, module='pdfplumber')
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-        return '\n'.join(text_parts)
+        workers = _pdf_page_workers()
+        
+        # Small documents are extracted right away; for large ones the same
+        # open only reads the page count used to split them across processes
+        pdf_path_str = str(pdf_path)
+        max_pages = _PDF_PARALLEL_MIN_PAGES if workers > 1 else None
+        page_count, page_texts = _extract_pdf_pages(pdf_path_str, max_pages=max_pages)
+        if page_texts is None:
+            page_texts = _extract_pdf_pages_parallel(pdf_path_str, page_count, workers)
+        
+        return '\n'.join(page_text for page_text in page_texts if page_text)
     except Exception as e:
         warnings.warn(f"Error extracting text from PDF {pdf_path}: {e}")
         return None
@@ -585,43 +829,48 @@ def extract_text_from_docx_with_fallback(docx_path: Path) -> Optional[str]:
             return None
 
 
-def _process_single_file(file_path: Path) -> Optional[dict]:
-    """Process a single file and return document dict or None (for parallel processing).
+_NO_DATE_PREFIX_REASON = "No date prefix (YYYY-MM-DD_) found in filename"
+
+
+def _process_single_file(file_path: Path) -> Tuple[Optional[dict], Optional[str]]:
+    """Process a single file into a document dict (used by both loading paths).
+    
+    Skips are reported back as a reason instead of a warning per file, so the
+    caller can summarize them once (and nothing is warned inside workers).
     
     Args:
         file_path: Path to the file to process
         
     Returns:
-        Document dict or None if processing failed
+        Tuple of (document dict or None, skip reason or None)
     """
     try:
+        # Parse date from filename prefix only (YYYY-MM-DD_ format)
+        # This is the standard format used in filtered_data directory.
+        # Checked before reading so skipped files are never read or decoded
+        date = parse_date_from_path(file_path)
+        if not date:
+            return None, _NO_DATE_PREFIX_REASON
+        
         # Extract text based on file type
         file_ext = file_path.suffix.lower()
         if file_ext == '.pdf':
             content = extract_text_from_pdf(file_path)
             if not content:
-                return None
+                return None, "Could not extract text from PDF"
         elif file_ext == '.docx':
             content = extract_text_from_docx_with_fallback(file_path)
             if not content:
-                return None
+                return None, "Could not extract text from DOCX"
         elif file_ext in ['.html', '.htm']:
             content = extract_text_from_html(file_path)
             if not content:
-                return None
+                return None, "Could not extract text from HTML"
         else:
             # Assume TXT file
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                 content = f.read()
         
-        # Parse date from filename prefix only (YYYY-MM-DD_ format)
-        # This is the standard format used in filtered_data directory
-        date = parse_date_from_path(file_path)
-        if not date:
-            # If no prefix date found, skip this file
-            warnings.warn(f"No date prefix (YYYY-MM-DD_) found in filename for {file_path}, skipping")
-            return None
-        
         # Parse title
         title = parse_title_from_text(content)
         if not title:
@@ -636,7 +885,7 @@ def _process_single_file(file_path: Path) -> Optional[dict]:
         text = extract_body_text(content)
         
         if not text.strip():
-            return None
+            return None, "Empty text"
         
         doc_id = f"{file_path.stem}_{file_path.parent.name}"
         
@@ -646,10 +895,22 @@ def _process_single_file(file_path: Path) -> Optional[dict]:
             'title': title,
             'text': text,
             'source': source
-        }
+        }, None
     except Exception as e:
-        warnings.warn(f"Error processing {file_path}: {e}")
-        return None
+        return None, f"Error processing file ({e})"
+
+
+def _warn_skipped_files(skip_reasons: Counter, skip_examples: Dict[str, List[Path]]) -> None:
+    """Emit one warning per skip reason with a few example files.
+    
+    Args:
+        skip_reasons: Number of skipped files per reason
+        skip_examples: First few skipped files per reason
+    """
+    for reason, count in skip_reasons.items():
+        examples = ', '.join(str(file_path) for file_path in skip_examples[reason])
+        more = ", ..." if count > len(skip_examples[reason]) else ""
+        warnings.warn(f"{reason}: skipped {count} files (e.g. {examples}{more})")
 
 
 def extract_body_text(text: str) -> str:
@@ -661,23 +922,32 @@ def extract_body_text(text: str) -> str:
     Returns:
         Body text without headers
     """
-    lines = text.split('\n')
-    body_lines = []
-    skip_headers = False
-    
-    for line in lines:
-        # Skip header lines
-        if re.match(r'^(Title|Date|Source):', line, re.IGNORECASE):
-            skip_headers = True
-            continue
-        
-        # After headers, start collecting body
-        if skip_headers and line.strip():
-            body_lines.append(line)
-        elif not skip_headers:
-            body_lines.append(line)
+    # Find the first header line with one scan; text without any (e.g.
+    # converted PDF/DOCX text) is returned without splitting it into lines
+    first = _HEADER_SEARCH_RE.search(text)
+    if first is None:
+        return text.strip()
     
-    return '\n'.join(body_lines).strip()
+    # Lines before the first header are kept as they are; after it, header
+    # and blank lines are dropped in one regex pass
+    start = first.start()
+    return (text[:start] + _HEADER_OR_BLANK_LINE_RE.sub('', text[start:])).strip()
+
+
+def has_date_prefix(filename: str) -> bool:
+    """Check whether a filename starts with YYYY-MM-DD_ without running a regex.
+    
+    Same result as matching r'^\\d{4}-\\d{2}-\\d{2}_' (str.isdecimal accepts
+    exactly the characters \\d does), at a fraction of the cost per name.
+    
+    Args:
+        filename: File name to check
+        
+    Returns:
+        True if the name has a date prefix
+    """
+    return (len(filename) > 10 and filename[4] == '-' and filename[7] == '-' and filename[10] == '_'
+            and filename[:4].isdecimal() and filename[5:7].isdecimal() and filename[8:10].isdecimal())
 
 
 def check_files_without_prefix_date(all_files: List[Path]) -> List[Path]:
@@ -694,13 +964,45 @@ def check_files_without_prefix_date(all_files: List[Path]) -> List[Path]:
     # Check each file for date prefix
     for file_path in all_files:
         # Check if filename starts with YYYY-MM-DD_ format
-        if not re.match(r'^\d{4}-\d{2}-\d{2}_', file_path.name):
+        if not has_date_prefix(file_path.name):
             files_without_prefix.append(file_path)
     
     return files_without_prefix
 
 
-def load_txt_articles(input_dir: Path, output_dir: Path, source_folders: Optional[List[str]] = None) -> pd.DataFrame:
+def iter_files(root: Path, suffixes: Tuple[str, ...]) -> Iterator[str]:
+    """Recursively yield files under root whose name ends with one of the suffixes.
+    
+    Walks with os.scandir, so file/directory checks use the type cached on each
+    DirEntry instead of the extra stat per entry that rglob makes. Directories
+    are visited in the same (pre-)order as rglob.
+    
+    Args:
+        root: Directory to search
+        suffixes: Suffixes including the dot (e.g. ('.txt',)), matched
+            case-sensitively like rglob's patterns
+        
+    Yields:
+        File paths as strings
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.endswith(suffixes):
+                        yield entry.path
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+def load_txt_articles(input_dir: Path, output_dir: Path, source_folders: Optional[List[str]] = None,
+                      pdf_backend: Optional[str] = None) -> pd.DataFrame:
     """Load all TXT, PDF, and DOCX articles from directory recursively.
     
     Args:
@@ -708,17 +1010,23 @@ def load_txt_articles(input_dir: Path, output_dir: Path, source_folders: Optiona
         output_dir: Directory to save processed documents
         source_folders: List of folder names to read from (e.g., ['meeting', 'news', 'reddit']).
                        If None, reads from all subdirectories.
+        pdf_backend: PDF text backend to use (see set_pdf_backend); None keeps
+                    the current one
         
     Returns:
         DataFrame with columns: doc_id, date, title, text, source
     """
-    # Get all supported files recursively (rglob searches all subdirectories)
+    if pdf_backend is not None:
+        set_pdf_backend(pdf_backend)
+    
+    # Get all supported files recursively in one walk (searches all subdirectories)
     # This will find files in: folder/file.txt, folder/subfolder/file.txt, folder/sub1/sub2/file.txt, etc.
-    txt_files = list(input_dir.rglob('*.txt'))
-    pdf_files = list(input_dir.rglob('*.pdf')) if PDF_SUPPORT else []
-    docx_files = list(input_dir.rglob('*.docx')) + list(input_dir.rglob('*.DOCX'))
+    suffixes = ('.txt', '.pdf', '.docx', '.DOCX') if PDF_SUPPORT else ('.txt', '.docx', '.DOCX')
+    files_by_suffix: Dict[str, List[Path]] = {suffix: [] for suffix in suffixes}
+    for path_str in iter_files(input_dir, suffixes):
+        files_by_suffix['.' + path_str.rpartition('.')[2]].append(Path(path_str))
     
-    all_files = txt_files + pdf_files + docx_files
+    all_files = [file_path for suffix in suffixes for file_path in files_by_suffix[suffix]]
     
     # Filter by source folders if specified
     # Note: This checks only the first folder in the path, so files in subdirectories
@@ -777,54 +1085,78 @@ def load_txt_articles(input_dir: Path, output_dir: Path, source_folders: Optiona
             f"리포트 파일: {report_path}"
         )
     
+    documents = []
+    
+    # Skipped files are counted per reason and reported once at the end
+    skip_reasons: Counter = Counter()
+    skip_examples: Dict[str, List[Path]] = defaultdict(list)
+    
+    def record(file_path: Path, result: Tuple[Optional[dict], Optional[str]]) -> None:
+        document, reason = result
+        if document:
+            documents.append(document)
+        else:
+            skip_reasons[reason] += 1
+            if len(skip_examples[reason]) < 5:
+                skip_examples[reason].append(file_path)
+    
+    # Files whose name yields no date would be skipped by the workers anyway,
+    # so count them as skipped here instead of handing them to the workers.
+    # This uses the same (cached) parse_date_from_path check as
+    # _process_single_file: names without the YYYY-MM-DD_ prefix may still
+    # carry a date (e.g. "Nov. 07, 2018 story.txt")
+    num_files = len(all_files)
+    files_to_process = []
+    for file_path in all_files:
+        if parse_date_from_path(file_path):
+            files_to_process.append(file_path)
+        else:
+            record(file_path, (None, _NO_DATE_PREFIX_REASON))
+    
     # Process files in parallel
     cpu_count = os.cpu_count() or 1
     max_workers = max(1, int(cpu_count * 0.7))
-    num_files = len(all_files)
-    workers = min(max_workers, num_files)
-    
-    documents = []
+    num_to_process = len(files_to_process)
+    workers = min(max_workers, num_to_process)
     
-    if num_files > 10 and workers > 1:
+    if num_to_process > 10 and workers > 1:
         # Parallel processing for large file sets
-        processed_files = set()
         failed_files = []
-        skipped_files = []
         
-        with ProcessPoolExecutor(max_workers=workers) as executor:
-            futures = {executor.submit(_process_single_file, file_path): file_path for file_path in all_files}
+        # Hand files to the processes in chunks to amortize pickling/IPC per file
+        chunksize = max(1, num_to_process // (workers * 4))
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_pdf_worker,
+                                 initargs=(PDF_BACKEND,)) as executor:
+            results = executor.map(_process_single_file, files_to_process, chunksize=chunksize)
             
-            # Process all futures and track results
-            for future in tqdm(as_completed(futures), total=len(futures), desc="Loading files"):
-                file_path = futures[future]
-                try:
-                    result = future.result()
-                    if result:
-                        documents.append(result)
-                        processed_files.add(file_path)
-                    else:
-                        # File was processed but returned None (skipped due to validation issues)
-                        skipped_files.append(file_path)
-                except Exception as e:
-                    # File processing failed with exception
+            # Process all results (in input order) and track them
+            file_iter = iter(files_to_process)
+            try:
+                for result in tqdm(results, total=num_to_process, desc="Loading files"):
+                    record(next(file_iter), result)
+            except Exception as e:
+                # Per-file errors are caught in the worker, so this means the pool itself failed
+                for file_path in file_iter:
                     failed_files.append((file_path, str(e)))
-                    warnings.warn(f"Failed to process file {file_path}: {e}")
+                warnings.warn(f"Parallel file loading stopped early: {e}")
         
         # Verify all files were processed
-        total_processed = len(processed_files) + len(skipped_files) + len(failed_files)
+        num_skipped = sum(skip_reasons.values())
+        total_processed = len(documents) + num_skipped + len(failed_files)
         if total_processed != num_files:
             missing_count = num_files - total_processed
             warnings.warn(
                 f"파일 처리 누락 경고: {missing_count}개 파일이 처리되지 않았습니다. "
-                f"(전체: {num_files}, 처리됨: {len(processed_files)}, 스킵됨: {len(skipped_files)}, 실패: {len(failed_files)})"
+                f"(전체: {num_files}, 처리됨: {len(documents)}, 스킵됨: {num_skipped}, 실패: {len(failed_files)})"
             )
         
         # Log detailed statistics
-        if failed_files or skipped_files:
+        if failed_files or num_skipped:
             warnings.warn(
                 f"파일 처리 요약: "
-                f"성공 {len(processed_files)}개, "
-                f"스킵 {len(skipped_files)}개, "
+                f"성공 {len(documents)}개, "
+                f"스킵 {num_skipped}개, "
                 f"실패 {len(failed_files)}개"
             )
             if failed_files:
@@ -835,71 +1167,21 @@ def load_txt_articles(input_dir: Path, output_dir: Path, source_folders: Optiona
                     warnings.warn(f"  ... 외 {len(failed_files) - 10}개 파일 실패")
     else:
         # Sequential processing for small file sets
-        for file_path in tqdm(all_files, desc="Loading files"):
-            try:
-                # Extract text based on file type
-                file_ext = file_path.suffix.lower()
-                if file_ext == '.pdf':
-                    content = extract_text_from_pdf(file_path)
-                    if not content:
-                        warnings.warn(f"Could not extract text from PDF {file_path}, skipping")
-                        continue
-                elif file_ext == '.docx':
-                    content = extract_text_from_docx_with_fallback(file_path)
-                    if not content:
-                        warnings.warn(f"Could not extract text from DOCX {file_path}, skipping")
-                        continue
-                else:
-                    # Assume TXT file
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                
-                # Parse date from filename prefix only (YYYY-MM-DD_ format)
-                # This is the standard format used in filtered_data directory
-                date = parse_date_from_path(file_path)
-                if not date:
-                    warnings.warn(f"No date prefix (YYYY-MM-DD_) found in filename for {file_path}, skipping")
-                    continue
-                
-                # Parse title
-                title = parse_title_from_text(content)
-                if not title:
-                    title = file_path.stem
-                
-                # Parse source
-                source = parse_source_from_text(content)
-                if not source:
-                    source = "unknown"
-                
-                # Extract body
-                text = extract_body_text(content)
-                
-                if not text.strip():
-                    warnings.warn(f"Empty text for {file_path}, skipping")
-                    continue
-                
-                doc_id = f"{file_path.stem}_{file_path.parent.name}"
-                
-                documents.append({
-                    'doc_id': doc_id,
-                    'date': date,
-                    'title': title,
-                    'text': text,
-                    'source': source
-                })
-                
-            except Exception as e:
-                warnings.warn(f"Error processing {file_path}: {e}")
-                continue
+        for file_path in tqdm(files_to_process, desc="Loading files"):
+            record(file_path, _process_single_file(file_path))
+    
+    _warn_skipped_files(skip_reasons, skip_examples)
     
     if not documents:
         raise ValueError("No valid documents loaded")
     
     df = pd.DataFrame(documents)
     
-    # Convert dates with error handling for invalid dates
+    # Convert dates with error handling for invalid dates. Dates always come
+    # from parse_date_from_path as YYYY-MM-DD, so the fixed ISO format is
+    # parsed vectorized instead of inferring a format per element
     try:
-        df['date'] = pd.to_datetime(df['date'], errors='coerce', format='mixed')
+        df['date'] = pd.to_datetime(df['date'], errors='coerce', format='%Y-%m-%d')
     except Exception as e:
         # Fallback: try with errors='coerce' to handle invalid dates
         warnings.warn(f"Error parsing dates, attempting with errors='coerce': {e}")
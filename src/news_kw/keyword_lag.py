@@ -1,8 +1,10 @@
 """Keyword lag analysis: Check if keywords from source groups appear later in target group."""
 
+import os
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import logging
 
 
@@ -22,58 +24,107 @@ def load_keyword_by_date(csv_path: Path) -> pd.DataFrame:
     if not csv_path.exists():
         return pd.DataFrame()
     
-    df = pd.read_csv(csv_path)
-    # Date format is YYYY-MM (monthly), convert to datetime (first day of month)
-    df['date'] = pd.to_datetime(df['date'] + '-01')
+    # Date format is YYYY-MM (monthly), parsed to datetime (first day of month) while reading
+    df = pd.read_csv(csv_path, engine='pyarrow', parse_dates=['date'])
+    # Normalize tokens once so exclude filtering can use a plain hash lookup
+    df['token'] = df['token'].str.lower().astype('category')
     return df
 
 
-def get_monthly_topn_keywords(df: pd.DataFrame, top_n: int, exclude_keywords: List[str]) -> Dict[str, List[str]]:
+def get_monthly_topn_keywords(df: pd.DataFrame, top_n: int,
+                              exclude_set: FrozenSet[str] = frozenset()) -> Dict[str, List[str]]:
     """Get Top N keywords for each month.
     
     Args:
-        df: DataFrame with columns: date, token, freq
+        df: DataFrame with columns: date, token, freq (tokens lowercased,
+            as returned by load_keyword_by_date)
         top_n: Number of top keywords to select per month
-        exclude_keywords: List of keywords to exclude
+        exclude_set: Lowercased keywords to exclude
         
     Returns:
         Dict mapping month (YYYY-MM format) to list of top N keywords
     """
     # Filter out exclude keywords
-    if exclude_keywords:
-        exclude_set = {kw.lower() for kw in exclude_keywords}
-        df = df[~df['token'].str.lower().isin(exclude_set)].copy()
+    if exclude_set:
+        df = df[~df['token'].isin(exclude_set)]
     
-    # Add year-month column
-    df['year_month'] = df['date'].dt.to_period('M').astype(str)
+    # Period-typed year-month key as a standalone Series (the input frame is not modified)
+    year_month = df['date'].dt.to_period('M').rename('year_month')
     
-    # For each month, get Top N keywords by frequency
-    monthly_topn = {}
+    # Aggregate frequency by (month, token) in a single pass
+    agg = df.groupby([year_month, df['token']], observed=True, sort=False)['freq'].sum()
     
-    for month in sorted(df['year_month'].unique()):
-        month_data = df[df['year_month'] == month].copy()
-        
-        # Aggregate frequency by token for this month
-        token_freq = month_data.groupby('token')['freq'].sum().reset_index()
-        token_freq = token_freq.sort_values('freq', ascending=False)
-        
-        # Get Top N
-        top_tokens = token_freq.head(top_n)['token'].tolist()
-        monthly_topn[month] = top_tokens
+    # Get Top N per month (heap-based selection, no full sort)
+    top = agg.groupby(level='year_month', sort=False).nlargest(top_n)
+    top_tokens = pd.Series(
+        top.index.get_level_values(-1).astype(str),
+        index=top.index.get_level_values(0)
+    )
+    monthly_lists = top_tokens.groupby(level=0, sort=True).apply(list)
+    monthly_topn = {str(period): tokens for period, tokens in monthly_lists.items()}
     
     return monthly_topn
 
 
+def _process_source_group(group: str, csv_path: Path, top_n: int,
+                          exclude_set: FrozenSet[str]) -> Tuple[int, int, int, Optional[pd.DataFrame]]:
+    """Load one source group and collect first dates of its monthly Top N keywords.
+    
+    Top-level so it can be dispatched to a ProcessPoolExecutor worker.
+    
+    Args:
+        group: Source group name
+        csv_path: Path to the group's keyword_by_date.csv
+        top_n: Number of top keywords per month
+        exclude_set: Lowercased keywords to exclude
+        
+    Returns:
+        Tuple of (records loaded, months, monthly Top N keywords, DataFrame with
+        columns: year_month, token, source_first_date, source_group)
+    """
+    df = load_keyword_by_date(csv_path)
+    if len(df) == 0:
+        return 0, 0, 0, None
+    
+    monthly_topn = get_monthly_topn_keywords(df, top_n, exclude_set)
+    total_months = len(monthly_topn)
+    total_keywords = sum(len(kw_list) for kw_list in monthly_topn.values())
+    
+    # First date of each token within each month
+    year_month = df['date'].dt.to_period('M').rename('year_month')
+    first_dates = df.groupby(
+        [year_month, df['token']], observed=True, sort=False
+    )['date'].min()
+    
+    # Stringify only the unique index levels, not every row
+    first_dates.index = first_dates.index.set_levels(
+        [level.astype(str) for level in first_dates.index.levels]
+    )
+    src = first_dates.rename('source_first_date').reset_index()
+    
+    # Keep only the monthly Top N (month, token) pairs
+    topn_index = pd.MultiIndex.from_tuples(
+        [(month, token) for month, keywords in monthly_topn.items() for token in keywords],
+        names=['year_month', 'token']
+    )
+    src = src[src.set_index(['year_month', 'token']).index.isin(topn_index)]
+    
+    return len(df), total_months, total_keywords, src.assign(source_group=group)
+
+
 def analyze_keyword_lag_monthly(source_groups: List[str], target_group: str, 
-                                top_n: int, exclude_keywords: List[str],
+                                top_n: int, exclude_set: FrozenSet[str],
                                 output_dir: Path, logger: logging.Logger = None) -> pd.DataFrame:
     """Analyze if monthly Top N keywords from source groups appear later in target group.
     
+    Resolves each group's keyword_by_date.csv under output_dir and runs
+    compute_keyword_lag on them.
+    
     Args:
         source_groups: List of source group names (e.g., ['news', 'reddit'])
         target_group: Target group name (e.g., 'meeting')
         top_n: Number of top keywords per month
-        exclude_keywords: List of keywords to exclude
+        exclude_set: Lowercased keywords to exclude
         output_dir: Base output directory (output/tables)
         logger: Logger instance (optional)
         
@@ -81,110 +132,134 @@ def analyze_keyword_lag_monthly(source_groups: List[str], target_group: str,
         DataFrame with columns: token, source_group, source_month, source_first_date, 
                                 target_first_date, days_lag, appears_in_target
     """
-    if logger is None:
-        logger = logging.getLogger(__name__)
-    
-    # Load keyword_by_date for source groups
+    # Resolve keyword_by_date for source groups
     # Try overall folder first, then root folder (for backward compatibility)
-    source_keywords = {}
+    source_csv_paths = {}
     for group in source_groups:
         # Try overall folder first (current structure)
         csv_path = output_dir / group / 'overall' / 'keyword_by_date.csv'
         if not csv_path.exists():
             # Fallback to root folder (for backward compatibility)
             csv_path = output_dir / group / 'keyword_by_date.csv'
-        
-        df = load_keyword_by_date(csv_path)
-        if len(df) > 0:
-            source_keywords[group] = df
-            logger.info(f"Loaded {len(df)} keyword-date records from {group}")
-        else:
-            logger.warning(f"No keyword_by_date.csv found for source group: {group} (tried: {csv_path})")
+        source_csv_paths[group] = csv_path
     
-    # Load keyword_by_date for target group
-    # Try overall folder first, then root folder (for backward compatibility)
+    # Resolve keyword_by_date for target group
     target_csv_path = output_dir / target_group / 'overall' / 'keyword_by_date.csv'
     if not target_csv_path.exists():
         # Fallback to root folder (for backward compatibility)
         target_csv_path = output_dir / target_group / 'keyword_by_date.csv'
     
-    target_df = load_keyword_by_date(target_csv_path)
+    return compute_keyword_lag(source_csv_paths, target_group, target_csv_path,
+                               top_n, exclude_set, logger)
+
+
+def compute_keyword_lag(source_csv_paths: Dict[str, Path], target_group: str, target_csv_path: Path,
+                        top_n: int, exclude_set: FrozenSet[str],
+                        logger: logging.Logger = None) -> pd.DataFrame:
+    """Compare monthly Top N keywords of source groups against a target group.
+    
+    Source groups are independent of each other and are processed in parallel
+    when there is more than one. The target CSV is loaded on a background
+    thread meanwhile.
+    
+    Args:
+        source_csv_paths: Source group name -> path to its keyword_by_date.csv
+        target_group: Target group name (for log messages)
+        target_csv_path: Path to the target group's keyword_by_date.csv
+        top_n: Number of top keywords per month
+        exclude_set: Lowercased keywords to exclude
+        logger: Logger instance (optional)
+        
+    Returns:
+        DataFrame with columns: token, source_group, source_month, source_first_date, 
+                                target_first_date, days_lag, appears_in_target
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+    
+    source_groups = list(source_csv_paths)
+    
+    # Get monthly Top N keywords and their first dates for each source group
+    cpu_count = os.cpu_count() or 1
+    max_workers = max(1, int(cpu_count * 0.7))
+    workers = min(max_workers, len(source_groups))
+    
+    # Load the target on a background thread while the source groups are processed
+    with ThreadPoolExecutor(max_workers=1) as loader:
+        if len(source_groups) > 1 and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                result_iter = executor.map(
+                    _process_source_group,
+                    source_groups,
+                    [source_csv_paths[group] for group in source_groups],
+                    [top_n] * len(source_groups),
+                    [exclude_set] * len(source_groups)
+                )
+                # Workers are started by now, so no thread is alive when they fork
+                target_future = loader.submit(load_keyword_by_date, target_csv_path)
+                results = list(result_iter)
+        else:
+            target_future = loader.submit(load_keyword_by_date, target_csv_path)
+            results = [
+                _process_source_group(group, source_csv_paths[group], top_n, exclude_set)
+                for group in source_groups
+            ]
+        target_df = target_future.result()
+    
+    source_parts = []
+    for group, (num_records, total_months, total_keywords, src) in zip(source_groups, results):
+        if src is None:
+            logger.warning(f"No keyword_by_date.csv found for source group: {group} (tried: {source_csv_paths[group]})")
+            continue
+        logger.info(f"Loaded {num_records} keyword-date records from {group}")
+        logger.info(f"{group}: {total_months} months, {total_keywords} monthly Top {top_n} keywords")
+        source_parts.append(src)
+    
     if len(target_df) > 0:
         logger.info(f"Loaded {len(target_df)} keyword-date records from {target_group}")
     else:
         logger.warning(f"No keyword_by_date.csv found for target group: {target_group} (tried: {target_csv_path})")
     
-    # Get monthly Top N keywords for each source group
-    source_monthly_topn = {}
-    for group in source_groups:
-        if group in source_keywords:
-            monthly_topn = get_monthly_topn_keywords(source_keywords[group], top_n, exclude_keywords)
-            source_monthly_topn[group] = monthly_topn
-            total_months = len(monthly_topn)
-            total_keywords = sum(len(kw_list) for kw_list in monthly_topn.values())
-            logger.info(f"{group}: {total_months} months, {total_keywords} monthly Top {top_n} keywords")
-    
-    # Create target keyword first dates mapping
-    target_first_dates = {}
+    # Create target keyword first dates mapping (token -> first date)
+    target_first_dates = pd.Series(dtype='datetime64[ns]', name='date')
     if len(target_df) > 0:
         # Filter exclude keywords from target
-        if exclude_keywords:
-            exclude_set = {kw.lower() for kw in exclude_keywords}
-            target_df_filtered = target_df[~target_df['token'].str.lower().isin(exclude_set)].copy()
+        if exclude_set:
+            target_df_filtered = target_df[~target_df['token'].isin(exclude_set)]
         else:
-            target_df_filtered = target_df.copy()
+            target_df_filtered = target_df
         
-        target_first_dates = target_df_filtered.groupby('token')['date'].min().to_dict()
+        target_first_dates = target_df_filtered.groupby('token', observed=True)['date'].min()
     
-    # Analyze each keyword from monthly Top N
-    results = []
+    tgt = pd.DataFrame({
+        'token': target_first_dates.index.astype(str),
+        'target_first_date': target_first_dates.to_numpy()
+    })
     
-    for group in source_groups:
-        if group not in source_monthly_topn:
-            continue
-        
-        for month, keywords in source_monthly_topn[group].items():
-            # Get first date in this month for each keyword
-            month_start = pd.to_datetime(f"{month}-01")
-            month_end = month_start + pd.offsets.MonthEnd(0)
-            
-            month_data = source_keywords[group][
-                (source_keywords[group]['date'] >= month_start) &
-                (source_keywords[group]['date'] <= month_end)
-            ]
-            
-            for token in keywords:
-                # Get first date in this month
-                token_month_data = month_data[month_data['token'] == token]
-                if len(token_month_data) == 0:
-                    continue
-                
-                source_first_date = token_month_data['date'].min()
-                
-                # Check if keyword appears in target group
-                target_first_date = target_first_dates.get(token)
-                
-                if target_first_date is not None:
-                    # Keyword appears in target
-                    days_lag = (target_first_date - source_first_date).days
-                    appears_in_target = True
-                else:
-                    # Keyword does not appear in target
-                    days_lag = None
-                    appears_in_target = False
-                    target_first_date = None
-                
-                results.append({
-                    'token': token,
-                    'source_group': group,
-                    'source_month': month,
-                    'source_first_date': source_first_date,
-                    'target_first_date': target_first_date,
-                    'days_lag': days_lag,
-                    'appears_in_target': appears_in_target
-                })
-    
-    df = pd.DataFrame(results)
+    if source_parts:
+        merged = pd.concat(source_parts, ignore_index=True)
+    else:
+        merged = pd.DataFrame({
+            'year_month': pd.Series(dtype=str),
+            'token': pd.Series(dtype=str),
+            'source_first_date': pd.Series(dtype='datetime64[ns]'),
+            'source_group': pd.Series(dtype=str),
+        })
+    
+    # Check if each keyword appears in target group and compute lag in one shot
+    merged = merged.merge(tgt, on='token', how='left')
+    lag = (merged['target_first_date'] - merged['source_first_date']).dt.days
+    
+    # Nullable Int64 keeps days_lag integral when some keywords never appear in target
+    df = pd.DataFrame({
+        'token': merged['token'],
+        'source_group': pd.Categorical(merged['source_group']),
+        'source_month': merged['year_month'],
+        'source_first_date': merged['source_first_date'],
+        'target_first_date': merged['target_first_date'],
+        'days_lag': lag.astype('Int64'),
+        'appears_in_target': merged['target_first_date'].notna().to_numpy(dtype=bool)
+    })
     
     # Sort by source_month and token
     if len(df) > 0:
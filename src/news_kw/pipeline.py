@@ -6,7 +6,7 @@ import shutil
 import os
 import glob
 import pandas as pd
-import platform
+from dataclasses import replace
 from pathlib import Path
 from typing import List
 from concurrent.futures import ProcessPoolExecutor, as_completed
@@ -19,6 +19,7 @@ from news_kw.cooccurrence import calculate_cooccurrence
 from news_kw.viz import plot_keyword_trends, plot_keyword_map, plot_wordcloud_python
 from news_kw.similarity import create_similarity_analysis
 from news_kw.keyword_lag import analyze_keyword_lag_monthly
+from news_kw.rscript import find_conda_env_rscript
 
 
 def setup_logging(log_dir: Path):
@@ -40,68 +41,6 @@ def setup_logging(log_dir: Path):
     )
 
 
-def _find_conda_env_rscript(conda_env_name: str, logger: logging.Logger = None) -> Path:
-    """Find Rscript executable in the specified conda environment.
-    
-    Args:
-        conda_env_name: Name of the conda environment
-        logger: Optional logger for debug messages
-    
-    Returns:
-        Path to Rscript executable, or None if not found
-    """
-    # Try to get conda info to find environment path
-    try:
-        result = subprocess.run(
-            ['conda', 'env', 'list'],
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='replace',
-            check=True
-        )
-        
-        # Parse conda env list output to find environment path
-        for line in result.stdout.split('\n'):
-            if conda_env_name in line:
-                # Extract path (format: "env_name    /path/to/env")
-                parts = line.split()
-                if len(parts) >= 2:
-                    env_path = Path(parts[-1])
-                    
-                    # Find Rscript based on platform
-                    if platform.system() == 'Windows':
-                        rscript_path = env_path / 'Scripts' / 'Rscript.exe'
-                    else:
-                        rscript_path = env_path / 'bin' / 'Rscript'
-                    
-                    if rscript_path.exists():
-                        if logger:
-                            logger.debug(f"Found Rscript at: {rscript_path}")
-                        return rscript_path
-    except Exception as e:
-        if logger:
-            logger.warning(f"Failed to find conda environment path: {e}")
-    
-    # Fallback: try common conda installation paths
-    conda_base = os.environ.get('CONDA_PREFIX') or os.environ.get('CONDA_DEFAULT_ENV')
-    if conda_base:
-        conda_base_path = Path(conda_base).parent.parent if 'envs' in str(conda_base) else Path(conda_base)
-        env_path = conda_base_path / 'envs' / conda_env_name
-        
-        if platform.system() == 'Windows':
-            rscript_path = env_path / 'Scripts' / 'Rscript.exe'
-        else:
-            rscript_path = env_path / 'bin' / 'Rscript'
-        
-        if rscript_path.exists():
-            if logger:
-                logger.debug(f"Found Rscript at: {rscript_path}")
-            return rscript_path
-    
-    return None
-
-
 def run_r_scripts(project_root: Path, logger: logging.Logger, 
                   tables_dir: Path = None, figures_dir: Path = None,
                   r_scripts: List[str] = None):
@@ -119,7 +58,7 @@ def run_r_scripts(project_root: Path, logger: logging.Logger,
     conda_env_name = 'keyword-analysis'
     
     # Try to find Rscript in conda environment directly (more reliable than conda run on Windows)
-    rscript_path = _find_conda_env_rscript(conda_env_name, logger)
+    rscript_path = find_conda_env_rscript(conda_env_name, logger)
     
     if rscript_path and rscript_path.exists():
         # Use direct path to Rscript (more reliable on Windows)
@@ -272,7 +211,7 @@ def run_pipeline_single_group(group_name: str, folders: list, config: Config,
     
     # Step 1: Load TXT, PDF, and DOCX articles
     logger.info("Step 1: Loading TXT, PDF, and DOCX articles...")
-    documents_df = load_txt_articles(input_dir, processed_dir, folders)
+    documents_df = load_txt_articles(input_dir, processed_dir, folders, config.PDF_BACKEND)
     logger.info(f"Loaded {len(documents_df)} documents")
     
     # Step 2: Preprocess and tokenize
@@ -682,7 +621,10 @@ def run_pipeline(config_path: Path, input_dir: Path, output_dir: Path,
     if config.DATA_SOURCE_GROUPS:
         if not isinstance(config.DATA_SOURCE_GROUPS, dict):
             # Normalize if not already done
-            config.DATA_SOURCE_GROUPS = Config._normalize_data_source_groups(config.DATA_SOURCE_GROUPS)
+            config = replace(
+                config,
+                DATA_SOURCE_GROUPS=Config._normalize_data_source_groups(config.DATA_SOURCE_GROUPS)
+            )
         
         # Calculate number of workers (70% of CPU cores)
         cpu_count = os.cpu_count() or 1
@@ -824,7 +766,7 @@ def run_pipeline(config_path: Path, input_dir: Path, output_dir: Path,
             source_groups=['news', 'reddit'],
             target_group='meeting',
             top_n=config.KEYWORD_TOP_N,
-            exclude_keywords=exclude_keywords,
+            exclude_set=exclude_keywords,
             output_dir=tables_dir,
             logger=logger
         )
@@ -844,13 +786,14 @@ def run_pipeline(config_path: Path, input_dir: Path, output_dir: Path,
             logger.info(f"Keywords that appear in meeting: {appears_in_meeting} ({percentage:.1f}%)")
             
             # Analyze time lag for keywords that appear in meeting
-            df_with_lag = df[df['appears_in_target']].copy()
+            df_with_lag = df[df['appears_in_target']]
             if len(df_with_lag) > 0:
+                lag_stats = df_with_lag['days_lag'].agg(['mean', 'median', 'min', 'max'])
                 logger.info(f"Time Lag Statistics (for keywords appearing in meeting):")
-                logger.info(f"  Average lag: {df_with_lag['days_lag'].mean():.1f} days")
-                logger.info(f"  Median lag: {df_with_lag['days_lag'].median():.1f} days")
-                logger.info(f"  Min lag: {df_with_lag['days_lag'].min():.0f} days")
-                logger.info(f"  Max lag: {df_with_lag['days_lag'].max():.0f} days")
+                logger.info(f"  Average lag: {lag_stats['mean']:.1f} days")
+                logger.info(f"  Median lag: {lag_stats['median']:.1f} days")
+                logger.info(f"  Min lag: {lag_stats['min']:.0f} days")
+                logger.info(f"  Max lag: {lag_stats['max']:.0f} days")
         
         # Run R script to generate visualizations
         if create_r_figures:
@@ -875,15 +818,7 @@ def _run_group_wrapper(group_name: str, folders: list, config_dict: dict,
     object since it cannot be pickled.
     """
     # Recreate config from dict (since Config object cannot be pickled)
-    config = Config()
-    for key, value in config_dict.items():
-        if hasattr(config, key):
-            setattr(config, key, value)
-    
-    # Normalize DATA_SOURCE_GROUPS if needed
-    if hasattr(config, 'DATA_SOURCE_GROUPS') and config.DATA_SOURCE_GROUPS:
-        if not isinstance(config.DATA_SOURCE_GROUPS, dict):
-            config.DATA_SOURCE_GROUPS = Config._normalize_data_source_groups(config.DATA_SOURCE_GROUPS)
+    config = Config.from_dict(config_dict)
     
     # Create a separate logger for this process
     group_log_dir = output_dir / 'logs' / group_name
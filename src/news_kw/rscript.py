@@ -0,0 +1,69 @@
+"""Rscript lookup shared by the pipeline and the lag analysis script."""
+
+import logging
+import os
+import platform
+import subprocess
+from pathlib import Path
+
+
+def find_conda_env_rscript(conda_env_name: str, logger: logging.Logger = None) -> Path:
+    """Find Rscript executable in the specified conda environment.
+    
+    Args:
+        conda_env_name: Name of the conda environment
+        logger: Optional logger for debug messages
+    
+    Returns:
+        Path to Rscript executable, or None if not found
+    """
+    # Try to get conda info to find environment path
+    try:
+        result = subprocess.run(
+            ['conda', 'env', 'list'],
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            check=True
+        )
+        
+        # Parse conda env list output to find environment path
+        for line in result.stdout.split('\n'):
+            if conda_env_name in line:
+                # Extract path (format: "env_name    /path/to/env")
+                parts = line.split()
+                if len(parts) >= 2:
+                    env_path = Path(parts[-1])
+                    
+                    # Find Rscript based on platform
+                    if platform.system() == 'Windows':
+                        rscript_path = env_path / 'Scripts' / 'Rscript.exe'
+                    else:
+                        rscript_path = env_path / 'bin' / 'Rscript'
+                    
+                    if rscript_path.exists():
+                        if logger:
+                            logger.debug(f"Found Rscript at: {rscript_path}")
+                        return rscript_path
+    except Exception as e:
+        if logger:
+            logger.warning(f"Failed to find conda environment path: {e}")
+    
+    # Fallback: try common conda installation paths
+    conda_base = os.environ.get('CONDA_PREFIX') or os.environ.get('CONDA_DEFAULT_ENV')
+    if conda_base:
+        conda_base_path = Path(conda_base).parent.parent if 'envs' in str(conda_base) else Path(conda_base)
+        env_path = conda_base_path / 'envs' / conda_env_name
+        
+        if platform.system() == 'Windows':
+            rscript_path = env_path / 'Scripts' / 'Rscript.exe'
+        else:
+            rscript_path = env_path / 'bin' / 'Rscript'
+        
+        if rscript_path.exists():
+            if logger:
+                logger.debug(f"Found Rscript at: {rscript_path}")
+            return rscript_path
+    
+    return None
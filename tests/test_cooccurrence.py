@@ -0,0 +1,84 @@
+"""Tests for news_kw.cooccurrence."""
+
+import dataclasses
+import random
+from collections import Counter, defaultdict
+from itertools import combinations
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from news_kw import cooccurrence
+from news_kw.config import Config
+from news_kw.cooccurrence import _count_token_pairs, calculate_cooccurrence
+
+
+def _brute_force_pairs(doc_ids, tokens) -> Counter:
+    """Count documents per unordered token pair by enumerating each document."""
+    tokens_by_doc = defaultdict(set)
+    for doc_id, token in zip(doc_ids, tokens):
+        if doc_id is not None and token is not None:
+            tokens_by_doc[doc_id].add(token)
+    pairs = Counter()
+    for doc_tokens in tokens_by_doc.values():
+        pairs.update(combinations(sorted(doc_tokens), 2))
+    return pairs
+
+
+@pytest.mark.parametrize('dense_max_nodes, pair_block_rows, incidence_max_elements', [
+    (2048, 1 << 20, 1 << 22),
+    (2048, 1 << 20, 7),
+    (0, 1 << 20, 1 << 22),
+    (0, 3, 1 << 22),
+])
+def test_count_token_pairs_matches_brute_force(monkeypatch, dense_max_nodes, pair_block_rows,
+                                               incidence_max_elements):
+    monkeypatch.setattr(cooccurrence, '_DENSE_MAX_NODES', dense_max_nodes)
+    monkeypatch.setattr(cooccurrence, '_PAIR_BLOCK_ROWS', pair_block_rows)
+    monkeypatch.setattr(cooccurrence, '_INCIDENCE_MAX_ELEMENTS', incidence_max_elements)
+    rng = random.Random(0)
+    
+    for _ in range(50):
+        vocab = [f'tok{i}' for i in range(rng.randint(1, 20))]
+        num_docs = rng.randint(1, 25)
+        doc_ids = []
+        tokens = []
+        for _ in range(rng.randint(0, 150)):
+            doc_ids.append(None if rng.random() < 0.03 else f'doc{rng.randrange(num_docs)}')
+            tokens.append(None if rng.random() < 0.03 else rng.choice(vocab))
+        
+        uniques, pair_codes, counts = _count_token_pairs(
+            pd.Series(doc_ids, dtype=object), pd.Series(tokens, dtype=object).astype('category')
+        )
+        n = len(uniques)
+        got = {(uniques[code // n], uniques[code % n]): int(count) for code, count in zip(pair_codes, counts)}
+        
+        assert got == dict(_brute_force_pairs(doc_ids, tokens))
+        assert list(pair_codes) == sorted(pair_codes)
+
+
+def test_calculate_cooccurrence_matches_brute_force(tmp_path: Path):
+    rng = random.Random(1)
+    vocab = ['Flood', 'flood', 'seawall', 'budget', 'council', 'tsunami', 'levee', 'permit']
+    rows = [(f'doc{rng.randrange(40)}', rng.choice(vocab)) for _ in range(400)]
+    tokens_df = pd.DataFrame(rows, columns=['doc_id', 'token'])
+    tokens_df['date'] = '2021-01-01'
+    config = dataclasses.replace(Config(), COOC_NODE_TOP_N=100, COOC_EDGE_TOP_N=1000)
+    
+    calculate_cooccurrence(tokens_df, config, tmp_path, exclude_keywords=['FLOOD'])
+    
+    kept = [(doc_id, token) for doc_id, token in rows if token.lower() != 'flood']
+    pairs = _brute_force_pairs(*zip(*kept))
+    edges = pd.read_csv(tmp_path / 'cooccurrence_edges.csv')
+    expected_edges = sorted(((a, b, weight) for (a, b), weight in pairs.items()),
+                            key=lambda edge: (-edge[2], edge[0], edge[1]))
+    assert list(edges.itertuples(index=False, name=None)) == expected_edges
+    
+    doc_freq = Counter(token for _, token in set(kept))
+    nodes = pd.read_csv(tmp_path / 'cooccurrence_nodes.csv')
+    assert dict(zip(nodes['token'], nodes['doc_freq'])) == {
+        token: doc_freq[token] for token in set(edges['source']) | set(edges['target'])
+    }
+    assert nodes['doc_freq'].is_monotonic_decreasing
@@ -0,0 +1,38 @@
+"""Tests for news_kw.filter_files file discovery."""
+
+import os
+from pathlib import Path
+
+from news_kw.filter_files import RawFileIndex, _collect_raw_files
+from news_kw.io import PDF_SUPPORT
+
+
+def test_collect_raw_files_matches_extensions_case_sensitively(tmp_path: Path):
+    names = ['a.txt', 'b.TXT', 'c.pdf', 'd.PDF', 'e.html', 'f.HTML', 'g.htm', 'h.HTM',
+             'i.docx', 'j.DOCX', 'k.Docx', 'txt', 'notes.md']
+    (tmp_path / 'news').mkdir()
+    for name in names:
+        (tmp_path / 'news' / name).write_text('x', encoding='utf-8')
+    
+    found = _collect_raw_files(tmp_path, exclude_folders=[])
+    
+    # Same files, grouped in the same order, as the original globs
+    # (*.txt, *.pdf, *.html, *.htm, *.docx, *.DOCX)
+    expected = ['a.txt', 'c.pdf', 'e.html', 'g.htm', 'i.docx', 'j.DOCX']
+    if not PDF_SUPPORT:
+        expected.remove('c.pdf')
+    assert found == [os.path.join('news', name) for name in expected]
+
+
+def test_raw_file_index_matches_extensions_case_sensitively(tmp_path: Path):
+    folder = tmp_path / 'news'
+    folder.mkdir()
+    for name in ['2021-03-04_a.pdf', '2021-03-04_b.PDF', '2021-03-04_c.docx', '2021-03-04_d.DOCX']:
+        (folder / name).write_text('x', encoding='utf-8')
+    
+    candidates = RawFileIndex(tmp_path).candidates(Path('news'), '2021-03-04')
+    
+    # Only the lower-case patterns of the original raw_folder.glob calls
+    assert [os.path.basename(path_str) for path_str, _ in candidates] == [
+        '2021-03-04_a.pdf', '2021-03-04_c.docx',
+    ]
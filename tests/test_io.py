@@ -0,0 +1,264 @@
+"""Tests for news_kw.io loading and parsing."""
+
+import warnings
+from pathlib import Path
+
+import pytest
+
+from news_kw import io as news_io
+from news_kw.io import (
+    PDF_BACKENDS,
+    extract_body_text,
+    extract_text_from_html,
+    extract_text_from_pdf,
+    load_txt_articles,
+    parse_date_from_filename,
+    parse_date_from_text,
+    parse_source_from_text,
+    parse_title_from_text,
+    set_pdf_backend,
+)
+
+PDF_LINES = [
+    ['Council approves new seawall budget', 'Funding covers the 2021 fiscal year.'],
+    ['Residents raise flooding concerns', 'Second page of the fixture article.'],
+]
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+
+
+@pytest.fixture
+def mixed_corpus(tmp_path: Path) -> Path:
+    """Corpus mixing prefixed, otherwise dated and undated filenames."""
+    input_dir = tmp_path / 'raw'
+    _write(input_dir / 'news' / '2021-03-04_a.txt', 'Title: Prefixed\nSource: Wire\n\nprefixed body')
+    _write(input_dir / 'news' / 'Nov. 07, 2018 story.txt', 'month name body')
+    _write(input_dir / 'news' / 'report 2021_05_06.txt', 'underscore date body')
+    _write(input_dir / 'reddit' / 'undated note.txt', 'no date anywhere')
+    return input_dir
+
+
+def test_load_txt_articles_keeps_dated_names_without_prefix(mixed_corpus: Path, tmp_path: Path):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        df = load_txt_articles(mixed_corpus, tmp_path / 'out' / 'processed')
+    
+    loaded = dict(zip(df['doc_id'], df['date'].dt.strftime('%Y-%m-%d')))
+    assert loaded == {
+        'Nov. 07, 2018 story_news': '2018-11-07',
+        '2021-03-04_a_news': '2021-03-04',
+        'report 2021_05_06_news': '2021-05-06',
+    }
+    
+    prefixed = df.set_index('doc_id').loc['2021-03-04_a_news']
+    assert prefixed['title'] == 'Prefixed'
+    assert prefixed['source'] == 'Wire'
+    assert prefixed['text'] == 'prefixed body'
+    
+    assert (tmp_path / 'out' / 'processed' / 'documents.parquet').exists()
+
+
+def test_load_txt_articles_warns_about_undated_files(mixed_corpus: Path, tmp_path: Path):
+    with pytest.warns(UserWarning) as record:
+        load_txt_articles(mixed_corpus, tmp_path / 'out' / 'processed')
+    
+    messages = [str(w.message) for w in record]
+    assert any('undated note.txt' in message for message in messages)
+
+
+def test_load_txt_articles_matches_suffixes_case_sensitively(tmp_path: Path):
+    input_dir = tmp_path / 'raw'
+    _write(input_dir / 'news' / '2021-03-04_lower.txt', 'lower body')
+    _write(input_dir / 'news' / '2021-03-05_upper.TXT', 'upper body')
+    
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        df = load_txt_articles(input_dir, tmp_path / 'out' / 'processed')
+    
+    # Only *.txt is read, as with the original rglob patterns
+    assert list(df['doc_id']) == ['2021-03-04_lower_news']
+
+
+def test_load_txt_articles_source_folders(mixed_corpus: Path, tmp_path: Path):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        df = load_txt_articles(mixed_corpus, tmp_path / 'out' / 'processed', ['reddit', 'news'])
+        assert len(df) == 3
+        with pytest.raises(ValueError):
+            load_txt_articles(mixed_corpus, tmp_path / 'out' / 'processed', ['reddit'])
+
+
+def test_extract_body_text_drops_headers_and_blank_lines():
+    content = 'Lead\n\nTitle: T\n\nSource: S\nBody one\n  \nTitle: repeated\n  indented'
+    
+    # Lines before the first header are kept as they are
+    assert extract_body_text(content) == 'Lead\n\nBody one\n  indented'
+
+
+@pytest.fixture
+def fixture_pdf(tmp_path: Path) -> Path:
+    """Two-page PDF with known text lines, written with reportlab."""
+    canvas = pytest.importorskip('reportlab.pdfgen.canvas')
+    pdf_path = tmp_path / 'raw' / 'news' / '2021-06-01_council.pdf'
+    pdf_path.parent.mkdir(parents=True)
+    pdf = canvas.Canvas(str(pdf_path))
+    for page_lines in PDF_LINES:
+        y = 750
+        for line in page_lines:
+            pdf.drawString(72, y, line)
+            y -= 20
+        pdf.showPage()
+    pdf.save()
+    return pdf_path
+
+
+@pytest.fixture
+def restore_pdf_backend():
+    backend = news_io.PDF_BACKEND
+    yield
+    news_io.PDF_BACKEND = backend
+
+
+def _words(text: str) -> list:
+    return text.split()
+
+
+def test_default_pdf_backend_is_pdfplumber():
+    if 'pdfplumber' not in PDF_BACKENDS:
+        pytest.skip('pdfplumber not installed')
+    assert news_io.PDF_BACKEND == 'pdfplumber'
+
+
+@pytest.mark.parametrize('backend', ['pdfplumber', 'pypdfium2', 'pymupdf'])
+def test_extract_text_from_pdf_backends(backend: str, fixture_pdf: Path, restore_pdf_backend):
+    if backend not in PDF_BACKENDS:
+        pytest.skip(f'{backend} not installed')
+    set_pdf_backend(backend)
+    
+    text = extract_text_from_pdf(fixture_pdf)
+    
+    # All lines in page order; backends may only differ in whitespace
+    expected = [line for page_lines in PDF_LINES for line in page_lines]
+    assert _words(text) == _words(' '.join(expected))
+    assert '\r' not in text
+
+
+@pytest.fixture
+def large_pdf(tmp_path: Path) -> Path:
+    """PDF with more pages than the parallel extraction threshold."""
+    canvas = pytest.importorskip('reportlab.pdfgen.canvas')
+    pdf_path = tmp_path / 'large.pdf'
+    pdf = canvas.Canvas(str(pdf_path))
+    for page_number in range(news_io._PDF_PARALLEL_MIN_PAGES + 9):
+        pdf.drawString(72, 750, f'page{page_number:03d}')
+        pdf.showPage()
+    pdf.save()
+    return pdf_path
+
+
+def test_extract_text_from_large_pdf_keeps_page_order(large_pdf: Path, monkeypatch):
+    if not PDF_BACKENDS:
+        pytest.skip('no PDF backend installed')
+    # Split across processes even on single-core machines
+    monkeypatch.setattr(news_io, '_pdf_page_workers', lambda: 3)
+    try:
+        text = extract_text_from_pdf(large_pdf)
+        executor = news_io._pdf_page_executor
+        assert executor is not None
+        
+        # The next large PDF reuses the same pool
+        assert extract_text_from_pdf(large_pdf) == text
+        assert news_io._pdf_page_executor is executor
+    finally:
+        news_io._shutdown_pdf_page_executor()
+    
+    expected = [f'page{page_number:03d}' for page_number in range(news_io._PDF_PARALLEL_MIN_PAGES + 9)]
+    assert _words(text) == expected
+
+
+def test_set_pdf_backend_rejects_unavailable(restore_pdf_backend):
+    backend = news_io.PDF_BACKEND
+    with pytest.raises(ValueError):
+        set_pdf_backend('no-such-backend')
+    assert news_io.PDF_BACKEND == backend
+    
+    assert set_pdf_backend('auto') == (PDF_BACKENDS[0] if PDF_BACKENDS else None)
+
+
+def test_load_txt_articles_reads_pdf_with_pinned_backend(fixture_pdf: Path, tmp_path: Path,
+                                                         restore_pdf_backend):
+    if not PDF_BACKENDS:
+        pytest.skip('no PDF backend installed')
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        df = load_txt_articles(fixture_pdf.parents[1], tmp_path / 'out' / 'processed',
+                               pdf_backend=PDF_BACKENDS[-1])
+    
+    assert news_io.PDF_BACKEND == PDF_BACKENDS[-1]
+    assert len(df) == 1
+    document = df.iloc[0]
+    assert document['date'].strftime('%Y-%m-%d') == '2021-06-01'
+    assert document['title'] == '2021-06-01_council'
+    assert _words(document['text']) == _words(' '.join(line for page in PDF_LINES for line in page))
+
+
+@pytest.mark.parametrize('filename, expected', [
+    ('2021-03-04_Hello.txt', '2021-03-04'),
+    ('Nov. 07, 2018 Big news.txt', '2018-11-07'),
+    ('Sept. 5, 2020 hearing.txt', '2020-09-05'),
+    ('July 17_2020 x.txt', '2020-07-17'),
+    ('report 02_24_2022 final.txt', '2022-02-24'),
+    ('13_05_21 x.txt', '2021-05-13'),
+    ('weird name 2019-01-02.txt', '2019-01-02'),
+    ('2020.05.06 a&b.txt', '2020-05-06'),
+    ('Feb_2022 summary.txt', '2022-02-01'),
+    ('march-2021 x.txt', '2021-03-01'),
+    ('09_2024 minutes.txt', '2024-09-01'),
+    ('2019-07 report.txt', '2019-07-01'),
+    ('undated note.txt', None),
+])
+def test_parse_date_from_filename(filename: str, expected):
+    assert parse_date_from_filename(filename) == expected
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Date: 2020-01-02\nbody', '2020-01-02'),
+    ('Posted 1/14/20 by staff', '2020-01-14'),
+    ('On 19 December 2018 the council met', '2018-12-19'),
+    ('Updated: Oct. 09, 2018', '2018-10-09'),
+    ('Sept. 9, 2019 meeting', '2019-09-09'),
+    ('Broadcast: Tuesday, Aug. 17, 2021', '2021-08-17'),
+    ('Broadcast: Tuesday, Aug. 17', 'PARTIAL-08-17'),
+    ('text 2019-02-03 text', '2019-02-03'),
+    ('13/45/2020 then 2021-01-01', '2021-01-01'),
+    # Only the first "Word DD, YYYY" match is considered, even if it is not a month
+    ('Foo 12, 2020 and June 3, 2020', None),
+    ('nothing here', None),
+])
+def test_parse_date_from_text(text: str, expected):
+    assert parse_date_from_text(text) == expected
+
+
+def test_parse_date_from_text_prefers_matching_date():
+    text = 'Filed 1/2/2018. Meeting on Oct. 9, 2018'
+    
+    assert parse_date_from_text(text) == '2018-01-02'
+    assert parse_date_from_text(text, preferred_date='2018-10-09') == '2018-10-09'
+
+
+@pytest.mark.parametrize('use_lxml', [True, False])
+def test_extract_text_from_html(use_lxml: bool, tmp_path: Path, monkeypatch):
+    if use_lxml and not news_io.LXML_SUPPORT:
+        pytest.skip('lxml not installed')
+    monkeypatch.setattr(news_io, 'LXML_SUPPORT', use_lxml)
+    html_path = tmp_path / 'page.html'
+    html_path.write_text(
+        '<html><head><style>p {color: red}</style><script>var x = 1;</script></head>'
+        '<body><!-- note --><p>Hello&amp;  <b>world</b></p>\n<div>Second</div></body></html>',
+        encoding='utf-8'
+    )
+    
+    assert extract_text_from_html(html_path) == 'Hello& world Second'